@@ -7,16 +7,18 @@ MCP client implementation using only standard Python libraries. This approach
 avoids dependency issues with the fastmcp library in some environments.
 """
 
-import base64
 import json
 import os
 import sys
 import argparse
 from datetime import datetime, timezone
-from typing import Optional
+from typing import Any, Dict, Optional
 
 # Import shared MCP utility
-from mcp_utils import create_mcp_session
+from mcp_utils import create_mcp_session, decode_jwt_payload
+
+_SEP = "=" * 80
+_TIMESTAMP_FORMAT = '%Y-%m-%d %H:%M:%S UTC'
 
 
 def _check_token_expiration(
@@ -33,21 +35,12 @@ def _check_token_expiration(
     """
     try:
         # Decode JWT payload (without verification, just to check expiry)
-        parts = access_token.split('.')
-        if len(parts) != 3:
+        try:
+            token_data = decode_jwt_payload(access_token)
+        except ValueError:
             print("Warning: Invalid JWT format, cannot check expiration")
             return
 
-        # Decode payload
-        payload = parts[1]
-        # Add padding if needed
-        padding = len(payload) % 4
-        if padding:
-            payload += '=' * (4 - padding)
-
-        decoded = base64.urlsafe_b64decode(payload)
-        token_data = json.loads(decoded)
-
         # Check expiration
         exp = token_data.get('exp')
         if not exp:
@@ -56,16 +49,17 @@ def _check_token_expiration(
 
         exp_dt = datetime.fromtimestamp(exp, tz=timezone.utc)
         now = datetime.now(timezone.utc)
-        time_until_expiry = exp_dt - now
+        seconds_left = (exp_dt - now).total_seconds()
+        exp_str = exp_dt.strftime(_TIMESTAMP_FORMAT)
 
-        if time_until_expiry.total_seconds() < 0:
+        if seconds_left < 0:
             # Token is expired
-            print("=" * 80)
+            print(_SEP)
             print("TOKEN EXPIRED")
-            print("=" * 80)
-            print(f"Token expired at: {exp_dt.strftime('%Y-%m-%d %H:%M:%S UTC')}")
-            print(f"Current time is: {now.strftime('%Y-%m-%d %H:%M:%S UTC')}")
-            print(f"Token expired {abs(time_until_expiry.total_seconds()):.0f} seconds ago")
+            print(_SEP)
+            print(f"Token expired at: {exp_str}")
+            print(f"Current time is: {now.strftime(_TIMESTAMP_FORMAT)}")
+            print(f"Token expired {abs(seconds_left):.0f} seconds ago")
             print("")
             print("Please regenerate your token using one of these methods:")
             print("")
@@ -78,13 +72,13 @@ def _check_token_expiration(
             print("  3. Use M2M authentication:")
             print("     Set environment variables: CLIENT_ID, CLIENT_SECRET,")
             print("     KEYCLOAK_URL, KEYCLOAK_REALM")
-            print("=" * 80)
+            print(_SEP)
             sys.exit(1)
-        elif time_until_expiry.total_seconds() < 60:
+        elif seconds_left < 60:
             # Token expires soon
-            print(f"Warning: Token will expire in {int(time_until_expiry.total_seconds())} seconds at {exp_dt.strftime('%Y-%m-%d %H:%M:%S UTC')}")
+            print(f"Warning: Token will expire in {int(seconds_left)} seconds at {exp_str}")
         else:
-            print(f"Token is valid until {exp_dt.strftime('%Y-%m-%d %H:%M:%S UTC')} ({int(time_until_expiry.total_seconds())} seconds remaining)")
+            print(f"Token is valid until {exp_str} ({int(seconds_left)} seconds remaining)")
 
     except Exception as e:
         print(f"Warning: Could not check token expiration: {e}")
@@ -165,6 +159,9 @@ Examples:
   # Use token from file (e.g., for Cognito/OAuth servers)
   uv run mcp_client.py --url http://localhost/customer-support-assistant/mcp --token-file /path/to/.cognito_access_token list
 
+  # Reuse the MCP session across invocations for up to 5 minutes
+  uv run mcp_client.py --session-cache-ttl 300 list
+
 Authentication (priority order):
   1. --token-file: Path to file containing access token
   2. Environment variables: CLIENT_ID, CLIENT_SECRET, KEYCLOAK_URL, KEYCLOAK_REALM
@@ -174,6 +171,9 @@ Authentication (priority order):
                        help='Gateway URL (default: %(default)s)')
     parser.add_argument('--token-file',
                        help='Path to file containing access token (e.g., .cognito_access_token)')
+    parser.add_argument('--session-cache-ttl', type=int, default=0,
+                       help='Seconds to reuse an MCP session from earlier invocations, '
+                            'skipping the initialize handshake (default: %(default)s, disabled)')
     parser.add_argument('command', choices=['ping', 'list', 'call', 'init'],
                        help='Command to execute')
     parser.add_argument('--tool', help='Tool name for call command')
@@ -198,7 +198,8 @@ Authentication (priority order):
 
     # Create MCP session using shared utility (it will auto-load ingress token if needed)
     try:
-        with create_mcp_session(args.url, access_token) as client:
+        with create_mcp_session(args.url, access_token,
+                                session_cache_ttl=args.session_cache_ttl) as client:
             # Check what authentication was actually used
             if client.access_token:
                 if args.token_file:
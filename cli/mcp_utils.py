@@ -17,24 +17,183 @@ The client supports:
 - Automatic token loading from OAuth files
 """
 
+import base64
+import hashlib
 import json
 import logging
 import os
+import re
+import threading
 import time
-from pathlib import Path
-from typing import Dict, Any, Optional, Union
-import urllib.request
 import urllib.parse
-import urllib.error
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Callable, ClassVar, Dict, Any, Iterator, List, Optional, Tuple, Union
+
+import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+
+try:
+    import httpx
+except ImportError:
+    httpx = None
+
+try:
+    import h2  # noqa: F401 - enables HTTP/2 in httpx
+    _HTTP2_AVAILABLE = True
+except ImportError:
+    _HTTP2_AVAILABLE = False
 
 
 logger = logging.getLogger(__name__)
 
+# Params key (and experimental capability name) for the batch pipelining
+# extension: a batched call carrying it asks the gateway to splice a value
+# selected from an earlier call's response into its own params
+INPUT_FROM_PARAM = "x-input-from"
+
+# On-disk cache of MCP session ids so later CLI invocations can skip the
+# initialize handshake; only used when a client opts in with session_cache_ttl
+SESSION_CACHE_FILE = Path.home() / ".mcp-cache" / "session.json"
+
+# JSON-RPC error code MCP servers return for an unknown or expired session
+SESSION_NOT_FOUND_CODE = -32001
+
+# Upper bound on SSE bytes read while waiting for the first JSON event
+DEFAULT_MAX_SSE_BYTES = 8 << 20
+
+# Parsed token files keyed by path: (st_mtime_ns, st_size, access_token, expires_at)
+_TOKEN_CACHE: Dict[str, Tuple[int, int, Optional[str], float]] = {}
+
+_JSON_PATH_TOKEN = re.compile(r'\.([^.\[\]]+)|\[(\d+)\]')
+
+
+def _select_json_path(data: Any, path: str) -> Any:
+    """
+    Select a value from parsed JSON using a minimal JSONPath subset.
+
+    Supports dotted keys and list indexes, e.g. "$.result.tools[0].name".
+
+    Args:
+        data: Parsed JSON data
+        path: JSONPath expression starting with "$"
+
+    Returns:
+        Selected value
+
+    Raises:
+        ValueError: If the path is malformed or does not match the data
+    """
+    if not path.startswith('$'):
+        raise ValueError(f"JSON path must start with '$': {path}")
+
+    value = data
+    pos = 1
+    for match in _JSON_PATH_TOKEN.finditer(path, 1):
+        if match.start() != pos:
+            raise ValueError(f"Invalid JSON path: {path}")
+        pos = match.end()
+        key, index = match.groups()
+        try:
+            value = value[int(index)] if index is not None else value[key]
+        except (KeyError, IndexError, TypeError):
+            raise ValueError(f"JSON path {path} does not match response")
+    if pos != len(path):
+        raise ValueError(f"Invalid JSON path: {path}")
+    return value
+
+
+class _HTTPStatusError(Exception):
+    """Raised for non-2xx gateway responses; carries the HTTP status code."""
+
+    def __init__(self, status_code: int, message: str):
+        super().__init__(message)
+        self.status_code = status_code
+
+
+def _set_dotted_key(target: Dict[str, Any], dotted_key: str, value: Any) -> None:
+    """
+    Set a value in nested dicts using a dotted key, creating dicts as needed.
+
+    Nested dicts along the path are copied first, so dicts shared with the
+    caller's params are never modified.
+    """
+    *parents, leaf = dotted_key.split('.')
+    for key in parents:
+        target[key] = dict(target.get(key) or {})
+        target = target[key]
+    target[leaf] = value
+
+
+@dataclass
+class Call:
+    """
+    A single JSON-RPC call for MCPClient.call_batch.
+
+    When depends_on is set, the value selected by jsonpath from the response
+    of the call at index depends_on is written into this call's params at the
+    dotted key target (e.g. "name" or "arguments.params.query").
+    """
+    method: str
+    params: Optional[Dict[str, Any]] = None
+    depends_on: Optional[int] = None
+    jsonpath: Optional[str] = None
+    target: Optional[str] = None
+
+    def to_request(self, request_id: int) -> Dict[str, Any]:
+        """Serialize to a JSON-RPC request, emitting the pipelining extension."""
+        request = {
+            "jsonrpc": "2.0",
+            "id": request_id,
+            "method": self.method
+        }
+        params = dict(self.params) if self.params else {}
+        if self.depends_on is not None:
+            params[INPUT_FROM_PARAM] = {
+                "index": self.depends_on,
+                "select": self.jsonpath,
+                "target": self.target
+            }
+        if params:
+            request["params"] = params
+        return request
+
+
+def decode_jwt_payload(
+    access_token: str
+) -> Dict[str, Any]:
+    """
+    Decode the payload segment of a JWT without verifying its signature.
+
+    Args:
+        access_token: JWT access token to decode
+
+    Returns:
+        Parsed payload claims
+
+    Raises:
+        ValueError: If the token is not a three-part JWT with a JSON payload
+    """
+    parts = access_token.split('.')
+    if len(parts) != 3:
+        raise ValueError("Invalid JWT format")
+
+    payload = parts[1]
+    payload += '=' * (-len(payload) % 4)
+    try:
+        return json.loads(base64.urlsafe_b64decode(payload))
+    except ValueError:
+        raise ValueError("Invalid JWT format")
+
 
 def _load_oauth_token_from_file(token_file_path: Union[str, Path]) -> Optional[str]:
     """
     Load OAuth access token from JSON file.
 
+    Parsed tokens are cached by (mtime, size), so repeated loads of an
+    unchanged file skip reading and parsing it.
+
     Args:
         token_file_path: Path to OAuth token file
 
@@ -43,22 +202,32 @@ def _load_oauth_token_from_file(token_file_path: Union[str, Path]) -> Optional[s
     """
     try:
         token_path = Path(token_file_path)
-        if not token_path.exists():
+        cache_key = str(token_path)
+        try:
+            stat = token_path.stat()
+        except FileNotFoundError:
+            _TOKEN_CACHE.pop(cache_key, None)
             return None
 
-        with open(token_path, 'r') as f:
-            token_data = json.load(f)
-
-        # Support both flat and nested token structures
-        # Nested: {"tokens": {"access_token": "...", "expires_at": ...}}
-        # Flat: {"access_token": "...", "expires_at": ...}
-        if 'tokens' in token_data:
-            tokens = token_data['tokens']
-            access_token = tokens.get('access_token')
-            expires_at = tokens.get('expires_at', 0)
+        cached = _TOKEN_CACHE.get(cache_key)
+        if cached and cached[0] == stat.st_mtime_ns and cached[1] == stat.st_size:
+            _, _, access_token, expires_at = cached
         else:
-            access_token = token_data.get('access_token')
-            expires_at = token_data.get('expires_at', 0)
+            with open(token_path, 'r') as f:
+                token_data = json.load(f)
+
+            # Support both flat and nested token structures
+            # Nested: {"tokens": {"access_token": "...", "expires_at": ...}}
+            # Flat: {"access_token": "...", "expires_at": ...}
+            if 'tokens' in token_data:
+                tokens = token_data['tokens']
+                access_token = tokens.get('access_token')
+                expires_at = tokens.get('expires_at', 0)
+            else:
+                access_token = token_data.get('access_token')
+                expires_at = token_data.get('expires_at', 0)
+
+            _TOKEN_CACHE[cache_key] = (stat.st_mtime_ns, stat.st_size, access_token, expires_at)
 
         # Check if token is expired
         if expires_at and time.time() >= expires_at:
@@ -105,29 +274,204 @@ def _get_auth_token(
     return _load_oauth_token_from_file(ingress_token_path)
 
 
-class MCPClient:
+def _session_cache_key(gateway_url: str, *tokens: Optional[str]) -> str:
+    """Key cached sessions by gateway and credentials so identities never mix."""
+    material = "\n".join([gateway_url, *(token or "" for token in tokens)])
+    return hashlib.sha1(material.encode('utf-8')).hexdigest()
+
+
+def _read_session_cache() -> Dict[str, Dict[str, Any]]:
+    """Read the session cache file, returning an empty cache if unusable."""
+    try:
+        data = json.loads(SESSION_CACHE_FILE.read_bytes())
+    except (OSError, ValueError):
+        return {}
+    return data if isinstance(data, dict) else {}
+
+
+def _load_cached_session(cache_key: str, ttl: int) -> Optional[Dict[str, Any]]:
     """
-    MCP (Model Context Protocol) client implementation using standard Python libraries.
+    Load a cached MCP session if it is younger than ttl seconds.
 
-    This client handles JSON-RPC 2.0 communication over HTTP with MCP servers,
-    including authentication, session management, and response parsing.
+    Args:
+        cache_key: Key from _session_cache_key
+        ttl: Maximum session age in seconds
+
+    Returns:
+        Cache entry with session_id, established_at and initialize_result,
+        or None if there is no fresh entry
+    """
+    entry = _read_session_cache().get(cache_key)
+    if not isinstance(entry, dict) or not entry.get("session_id"):
+        return None
+    if time.time() - entry.get("established_at", 0) > ttl:
+        return None
+    return entry
+
+
+def _store_cached_session(
+    cache_key: str,
+    entry: Optional[Dict[str, Any]],
+    ttl: int
+) -> None:
+    """
+    Add, replace or (with entry=None) remove a cached MCP session.
+
+    The file is rewritten atomically via os.replace and entries older than
+    ttl are pruned. Failures are logged and ignored since the cache is only
+    an optimization.
+    """
+    cache = _read_session_cache()
+    now = time.time()
+    cache = {
+        key: value for key, value in cache.items()
+        if isinstance(value, dict) and now - value.get("established_at", 0) <= ttl
+    }
+    if entry is None:
+        cache.pop(cache_key, None)
+    else:
+        cache[cache_key] = entry
+
+    tmp_path = SESSION_CACHE_FILE.with_name(f"{SESSION_CACHE_FILE.name}.{os.getpid()}.tmp")
+    try:
+        SESSION_CACHE_FILE.parent.mkdir(mode=0o700, parents=True, exist_ok=True)
+        fd = os.open(tmp_path, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o600)
+        with os.fdopen(fd, 'w') as f:
+            json.dump(cache, f)
+        os.replace(tmp_path, SESSION_CACHE_FILE)
+    except OSError as e:
+        logger.debug(f"Could not update session cache {SESSION_CACHE_FILE}: {e}")
+
+
+class _SSEParser:
+    """
+    Incremental Server-Sent Events parser.
+
+    Implements the event-stream framing rules: bytes are buffered until a
+    complete line is available, comment lines (starting with ":") are
+    ignored, multiple "data:" fields of one event are joined with newlines,
+    and an event is dispatched only when the blank line ending it arrives.
+    """
+
+    def __init__(self):
+        self._buf = bytearray()
+        self._event: Dict[str, Any] = {"data": []}
+
+    def feed(self, chunk: bytes) -> Iterator[Dict[str, Any]]:
+        """
+        Feed raw bytes from the stream.
+
+        Args:
+            chunk: Bytes as received from the socket
+
+        Yields:
+            Completed events as {"data": str, "event": str, "id": str}
+        """
+        self._buf += chunk
+        while True:
+            newline = self._buf.find(b'\n')
+            if newline < 0:
+                # Leave the trailing partial line in the buffer
+                return
+            line = bytes(self._buf[:newline])
+            del self._buf[:newline + 1]
+            event = self._process_line(line.rstrip(b'\r'))
+            if event is not None:
+                yield event
+
+    def close(self) -> Iterator[Dict[str, Any]]:
+        """
+        Flush at end of stream.
+
+        The spec discards an unterminated final event; it is dispatched here
+        anyway because some servers omit the trailing blank line.
+        """
+        if self._buf:
+            line = bytes(self._buf)
+            self._buf.clear()
+            self._process_line(line.rstrip(b'\r'))
+        event = self._process_line(b'')
+        if event is not None:
+            yield event
+
+    def _process_line(self, line: bytes) -> Optional[Dict[str, Any]]:
+        """Apply one complete line to the current event."""
+        if not line:
+            return self._dispatch()
+        if line.startswith(b':'):
+            return None
+
+        field, sep, value = line.partition(b':')
+        if sep and value.startswith(b' '):
+            value = value[1:]
+
+        if field == b'data':
+            self._event["data"].append(value.decode('utf-8'))
+        elif field in (b'event', b'id'):
+            self._event[field.decode('ascii')] = value.decode('utf-8')
+        return None
+
+    def _dispatch(self) -> Optional[Dict[str, Any]]:
+        """Emit the current event and start a new one."""
+        event = self._event
+        self._event = {"data": []}
+        if not event["data"]:
+            return None
+        event["data"] = "\n".join(event["data"])
+        return event
+
+
+class _MCPClientBase:
     """
+    State and protocol helpers shared by the sync and async MCP clients.
+
+    Holds the tokens, session id and request counter, builds per-request
+    headers, and interprets responses independently of the HTTP library.
+    """
+
+    _DEFAULT_HEADERS = {
+        'Content-Type': 'application/json',
+        'Accept': 'application/json, text/event-stream',
+        'User-Agent': 'mcp-utils-client/1.0.0'
+    }
+
+    # Read timeout in seconds for notifications, which get no response body
+    _NOTIFICATION_TIMEOUT = 2
+
+    # Pre-encoded bodies for fixed-shape requests; only the id is patched in
+    _PING_TEMPLATE = b'{"jsonrpc":"2.0","id":%d,"method":"ping"}'
+    _LIST_TOOLS_TEMPLATE = b'{"jsonrpc":"2.0","id":%d,"method":"tools/list"}'
+    _INITIALIZED_BYTES = b'{"jsonrpc":"2.0","method":"notifications/initialized"}'
+    _INITIALIZE_TEMPLATE = (
+        b'{"jsonrpc":"2.0","id":%d,"method":"initialize","params":'
+        + json.dumps({
+            "protocolVersion": "2024-11-05",
+            "capabilities": {},
+            "clientInfo": {
+                "name": "mcp-utils-client",
+                "version": "1.0.0"
+            }
+        }, separators=(',', ':')).encode('utf-8')
+        + b'}'
+    )
 
     def __init__(
         self,
         gateway_url: str,
         access_token: Optional[str] = None,
         backend_token: Optional[str] = None,
-        timeout: int = 30
+        timeout: int = 30,
+        max_sse_bytes: int = DEFAULT_MAX_SSE_BYTES
     ):
         """
-        Initialize MCP client.
+        Initialize shared client state.
 
         Args:
             gateway_url: URL of the MCP gateway endpoint
             access_token: Optional Bearer token for backend server authentication (Authorization header)
             backend_token: Optional separate token for backend server (if different from gateway token)
             timeout: Request timeout in seconds
+            max_sse_bytes: Maximum bytes read from an SSE stream before giving up
         """
         self.gateway_url = gateway_url.rstrip('/')
         # Backend token for Authorization header (forwarded to backend servers)
@@ -137,8 +481,13 @@ class MCPClient:
         # Keep access_token for backwards compatibility
         self.access_token = self.backend_token or self.gateway_token
         self.timeout = timeout
+        self.max_sse_bytes = max_sse_bytes
         self.session_id: Optional[str] = None
+        self.server_capabilities: Dict[str, Any] = {}
         self._request_id = 0
+        self._headers_key: Optional[Tuple[Optional[str], ...]] = None
+        self._headers: Dict[str, str] = {}
+        self._tool_serializers: Dict[str, Callable[[Dict[str, Any], int], bytes]] = {}
 
     def _get_next_request_id(self) -> int:
         """Get next request ID for JSON-RPC calls."""
@@ -146,12 +495,19 @@ class MCPClient:
         return self._request_id
 
     def _build_headers(self) -> Dict[str, str]:
-        """Build HTTP headers for requests."""
-        headers = {
-            'Content-Type': 'application/json',
-            'Accept': 'application/json, text/event-stream',
-            'User-Agent': 'mcp-utils-client/1.0.0'
-        }
+        """
+        Build per-request HTTP headers.
+
+        Static headers (_DEFAULT_HEADERS) live on the pooled HTTP client;
+        only authentication and session headers are added here. The dict is
+        cached until a token or the session id changes, so callers must
+        treat it as read-only (both HTTP libraries merge it into a new dict).
+        """
+        headers_key = (self.gateway_token, self.backend_token, self.session_id)
+        if headers_key == self._headers_key:
+            return self._headers
+
+        headers = {}
 
         # X-Authorization: Gateway authentication (uses ingress token)
         if self.gateway_token:
@@ -164,84 +520,407 @@ class MCPClient:
         if self.session_id:
             headers['mcp-session-id'] = self.session_id
 
+        self._headers_key = headers_key
+        self._headers = headers
         return headers
 
-    def _make_request(self, payload: Dict[str, Any]) -> Dict[str, Any]:
+    def _get_tool_serializer(
+        self,
+        tool_name: str
+    ) -> Callable[[Dict[str, Any], int], bytes]:
+        """
+        Return an encoder for mcpgw tools/call requests to the given tool.
+
+        The constant part of the envelope is encoded once per tool name, so
+        each call only serializes the params and the request id.
+        """
+        serializer = self._tool_serializers.get(tool_name)
+        if serializer is None:
+            prefix = b'{"jsonrpc":"2.0","id":'
+            middle = (
+                b',"method":"tools/call","params":{"name":'
+                + json.dumps(tool_name).encode('utf-8')
+                + b',"arguments":{"params":'
+            )
+            suffix = b'}}}'
+
+            def serializer(params: Dict[str, Any], request_id: int) -> bytes:
+                return (
+                    prefix + str(request_id).encode() + middle
+                    + json.dumps(params).encode('utf-8') + suffix
+                )
+
+            self._tool_serializers[tool_name] = serializer
+        return serializer
+
+    def _update_session_id(self, response_headers: Any) -> None:
+        """Extract session ID from response headers if available."""
+        session_id = response_headers.get('mcp-session-id')
+        if session_id and not self.session_id:
+            self.session_id = session_id
+            logger.debug(f"Session ID established: {session_id}")
+
+    def _http_error_message(
+        self,
+        status_code: int,
+        reason: str,
+        body: Optional[bytes]
+    ) -> str:
+        """
+        Build the error message for a non-2xx response.
+
+        Args:
+            status_code: HTTP status code
+            reason: HTTP reason phrase, used when the body has no JSON error
+            body: Response body if it is JSON, None otherwise
+
+        Returns:
+            Error message
+        """
+        try:
+            detail = json.loads(body)['error']
+        except (ValueError, TypeError, KeyError):
+            detail = reason
+        return f"HTTP {status_code}: {detail}"
+
+    def _parse_sse_event(
+        self,
+        event: Dict[str, Any]
+    ) -> Optional[Union[Dict[str, Any], List[Dict[str, Any]]]]:
+        """Parse the JSON payload of a complete SSE event, None if it is not JSON."""
+        try:
+            return json.loads(event["data"])
+        except json.JSONDecodeError:
+            # Events are complete at this point, so this is not a partial read
+            logger.debug(f"Skipping non-JSON SSE event: {event.get('event', 'message')}")
+            return None
+
+    def _check_sse_size(self, bytes_read: int) -> None:
+        """Abort an SSE stream that exceeded max_sse_bytes without a usable event."""
+        if bytes_read > self.max_sse_bytes:
+            raise Exception(
+                f"SSE response too large: no complete JSON event within {self.max_sse_bytes} bytes"
+            )
+
+    def _unwrap_tool_response(self, response: Dict[str, Any]) -> Dict[str, Any]:
+        """Extract the result of a tools/call response, raising on errors."""
+        # Handle MCP response format
+        if "error" in response:
+            raise Exception(f"MCP tool error: {response['error']}")
+
+        if "result" in response:
+            return response["result"]
+
+        return response
+
+    def _store_capabilities(self, result: Dict[str, Any]) -> None:
+        """Remember server capabilities from an initialize response."""
+        init_result = result.get("result")
+        if isinstance(init_result, dict):
+            self.server_capabilities = init_result.get("capabilities") or {}
+
+
+class MCPClient(_MCPClientBase):
+    """
+    MCP (Model Context Protocol) client implementation using standard Python libraries.
+
+    This client handles JSON-RPC 2.0 communication over HTTP with MCP servers,
+    including authentication, session management, and response parsing.
+    """
+
+    # HTTP sessions shared by all clients in the process, keyed by origin,
+    # and the number of open clients using each of them
+    _SESSIONS: ClassVar[Dict[Tuple[str, Optional[str], Optional[int]], requests.Session]] = {}
+    _SESSION_USERS: ClassVar[Dict[Tuple[str, Optional[str], Optional[int]], int]] = {}
+    _SESSIONS_LOCK: ClassVar[threading.Lock] = threading.Lock()
+
+    def __init__(
+        self,
+        gateway_url: str,
+        access_token: Optional[str] = None,
+        backend_token: Optional[str] = None,
+        timeout: int = 30,
+        session_cache_ttl: int = 0,
+        max_sse_bytes: int = DEFAULT_MAX_SSE_BYTES
+    ):
+        """
+        Initialize MCP client.
+
+        Args:
+            gateway_url: URL of the MCP gateway endpoint
+            access_token: Optional Bearer token for backend server authentication (Authorization header)
+            backend_token: Optional separate token for backend server (if different from gateway token)
+            timeout: Request timeout in seconds
+            session_cache_ttl: Seconds a session id persisted in SESSION_CACHE_FILE
+                may be reused by later processes; 0 (the default) disables the cache
+            max_sse_bytes: Maximum bytes read from an SSE stream before giving up
+        """
+        super().__init__(gateway_url, access_token, backend_token, timeout, max_sse_bytes)
+
+        # Pooled HTTP session so every JSON-RPC call reuses the same keep-alive
+        # connection instead of paying a fresh TCP/TLS handshake per request
+        self._closed = False
+        self._http_key, self._http = self._acquire_shared_session(self.gateway_url)
+
+        # Reuse a session established by an earlier process, if still fresh
+        self.session_cache_ttl = session_cache_ttl
+        self._session_cache_key: Optional[str] = None
+        self._session_restored = False
+        self._restored_init_result: Optional[Dict[str, Any]] = None
+        if session_cache_ttl > 0:
+            self._session_cache_key = _session_cache_key(
+                self.gateway_url, self.gateway_token, self.backend_token
+            )
+            entry = _load_cached_session(self._session_cache_key, session_cache_ttl)
+            if entry:
+                self.session_id = entry["session_id"]
+                self._restored_init_result = entry.get("initialize_result")
+                self._session_restored = True
+                logger.debug(f"Restored cached MCP session: {self.session_id}")
+
+    @classmethod
+    def _acquire_shared_session(
+        cls,
+        gateway_url: str
+    ) -> Tuple[Tuple[str, Optional[str], Optional[int]], requests.Session]:
+        """
+        Return the process-wide HTTP session for the gateway's origin.
+
+        All clients talking to the same scheme/host/port share one session
+        and therefore one connection pool. Each call must be paired with
+        _release_shared_session.
+
+        Args:
+            gateway_url: URL of the MCP gateway endpoint
+
+        Returns:
+            Tuple of (origin key, shared requests session)
+        """
+        parsed = urllib.parse.urlparse(gateway_url)
+        key = (parsed.scheme, parsed.hostname, parsed.port)
+        with cls._SESSIONS_LOCK:
+            session = cls._SESSIONS.get(key)
+            if session is None:
+                session = requests.Session()
+                session.headers.update(cls._DEFAULT_HEADERS)
+                # Connection errors are retried; POSTs are never replayed after
+                # the request was sent since urllib3 only retries reads for
+                # idempotent methods
+                adapter = HTTPAdapter(
+                    pool_connections=4,
+                    pool_maxsize=8,
+                    max_retries=Retry(total=2, backoff_factor=0.1)
+                )
+                session.mount('http://', adapter)
+                session.mount('https://', adapter)
+                cls._SESSIONS[key] = session
+            cls._SESSION_USERS[key] = cls._SESSION_USERS.get(key, 0) + 1
+            return key, session
+
+    @classmethod
+    def _release_shared_session(
+        cls,
+        key: Tuple[str, Optional[str], Optional[int]]
+    ) -> None:
+        """Drop one user of a shared session, closing its sockets after the last."""
+        with cls._SESSIONS_LOCK:
+            users = cls._SESSION_USERS.get(key, 0) - 1
+            if users > 0:
+                cls._SESSION_USERS[key] = users
+                return
+            cls._SESSION_USERS.pop(key, None)
+            session = cls._SESSIONS.pop(key, None)
+        if session is not None:
+            session.close()
+
+    def _make_request(
+        self,
+        payload: Union[Dict[str, Any], List[Dict[str, Any]]]
+    ) -> Union[Dict[str, Any], List[Dict[str, Any]]]:
         """
         Make HTTP request to MCP gateway.
 
         Args:
-            payload: JSON-RPC payload
+            payload: JSON-RPC payload, or a list of payloads for a batch request
+
+        Returns:
+            Parsed response data (a list for batch requests)
+
+        Raises:
+            Exception: If request fails or response is invalid
+        """
+        return self._make_request_bytes(json.dumps(payload).encode('utf-8'))
+
+    def _make_request_bytes(
+        self,
+        data: bytes
+    ) -> Union[Dict[str, Any], List[Dict[str, Any]]]:
+        """
+        Make HTTP request to MCP gateway with an already encoded JSON-RPC body.
+
+        Args:
+            data: UTF-8 encoded JSON-RPC payload
+
+        Returns:
+            Parsed response data (a list for batch requests)
+
+        Raises:
+            Exception: If request fails or response is invalid
+        """
+        if not self._session_restored:
+            return self._post(data)
+
+        # The first request on a session restored from disk proves whether
+        # the gateway still knows it; if not, re-initialize and retry once
+        try:
+            response = self._post(data)
+        except _HTTPStatusError as e:
+            # Streamable HTTP servers answer 404 for sessions they do not know
+            if e.status_code != 404:
+                raise
+            logger.debug(f"Cached MCP session rejected: {e}")
+        else:
+            if not self._is_session_error(response):
+                self._session_restored = False
+                return response
+            logger.debug("Cached MCP session no longer valid")
+
+        self._discard_session()
+        self.initialize()
+        return self._make_request_bytes(data)
+
+    def _is_session_error(self, response: Union[Dict[str, Any], List[Dict[str, Any]]]) -> bool:
+        """Check whether a JSON-RPC response reports an unknown or expired session."""
+        if not isinstance(response, dict):
+            return False
+        error = response.get("error")
+        return isinstance(error, dict) and error.get("code") == SESSION_NOT_FOUND_CODE
+
+    def _discard_session(self) -> None:
+        """Forget the current session here and in the on-disk cache."""
+        self.session_id = None
+        self._session_restored = False
+        self._restored_init_result = None
+        if self._session_cache_key:
+            _store_cached_session(self._session_cache_key, None, self.session_cache_ttl)
+
+    def _post(self, data: bytes) -> Union[Dict[str, Any], List[Dict[str, Any]]]:
+        """
+        POST an encoded JSON-RPC body and parse the response.
+
+        Args:
+            data: UTF-8 encoded JSON-RPC payload
 
         Returns:
-            Parsed response data
+            Parsed response data (a list for batch requests)
 
         Raises:
             Exception: If request fails or response is invalid
         """
         headers = self._build_headers()
-        data = json.dumps(payload).encode('utf-8')
 
         try:
-            request = urllib.request.Request(
+            response = self._http.post(
                 self.gateway_url,
                 data=data,
                 headers=headers,
-                method='POST'
+                timeout=self.timeout,
+                stream=True
             )
+        except requests.exceptions.RequestException as e:
+            raise Exception(f"Network error: {e}")
 
-            with urllib.request.urlopen(request, timeout=self.timeout) as response:
-                response_data = response.read().decode('utf-8')
-                content_type = response.headers.get('content-type', '')
+        with response:
+            if not response.ok:
+                # Only JSON error bodies carry detail worth reading
+                is_json = 'json' in response.headers.get('content-type', '')
+                raise _HTTPStatusError(response.status_code, self._http_error_message(
+                    response.status_code, response.reason, response.content if is_json else None
+                ))
 
-                # Extract session ID from response headers if available
-                session_id = response.headers.get('mcp-session-id')
-                if session_id and not self.session_id:
-                    self.session_id = session_id
-                    logger.debug(f"Session ID established: {session_id}")
+            content_type = response.headers.get('content-type', '')
+            self._update_session_id(response.headers)
 
+            try:
                 # Handle Server-Sent Events (SSE) response
                 if 'text/event-stream' in content_type:
-                    return self._parse_sse_response(response_data)
+                    return self._parse_sse_response(response)
                 else:
                     # Handle regular JSON response
-                    return json.loads(response_data)
+                    return json.loads(self._read_json_body(response))
 
-        except urllib.error.HTTPError as e:
-            error_msg = f"HTTP {e.code}: {e.reason}"
-            try:
-                error_response = e.read().decode('utf-8')
-                error_data = json.loads(error_response)
-                if 'error' in error_data:
-                    error_msg = f"HTTP {e.code}: {error_data['error']}"
-            except (json.JSONDecodeError, UnicodeDecodeError):
-                pass
-            raise Exception(error_msg)
+            except requests.exceptions.RequestException as e:
+                raise Exception(f"Network error: {e}")
 
-        except urllib.error.URLError as e:
-            raise Exception(f"Network error: {e.reason}")
+            except json.JSONDecodeError as e:
+                raise Exception(f"Invalid JSON response: {e}")
 
-        except json.JSONDecodeError as e:
-            raise Exception(f"Invalid JSON response: {e}")
+    def _read_json_body(self, response: requests.Response) -> Union[bytes, bytearray]:
+        """
+        Read a non-streaming response body with as few copies as possible.
+
+        When the size is known up front (Content-Length without a content
+        encoding) the body is read straight from the socket into one
+        preallocated buffer instead of joining chunks into a new bytes object.
+
+        Args:
+            response: Streaming HTTP response
 
-    def _parse_sse_response(self, sse_data: str) -> Dict[str, Any]:
+        Returns:
+            Raw response body
+        """
+        content_length = response.headers.get('content-length', '')
+        if (not content_length.isdigit() or int(content_length) == 0
+                or response.headers.get('content-encoding')):
+            return response.content
+
+        buf = bytearray(int(content_length))
+        view = memoryview(buf)
+        pos = 0
+        while pos < len(buf):
+            read = response.raw.readinto(view[pos:])
+            if not read:
+                break
+            pos += read
+        view.release()
+        if pos < len(buf):
+            del buf[pos:]
+        return buf
+
+    def _parse_sse_response(
+        self,
+        response: requests.Response
+    ) -> Union[Dict[str, Any], List[Dict[str, Any]]]:
         """
-        Parse Server-Sent Events response format.
+        Parse Server-Sent Events response incrementally.
+
+        Chunks are fed to _SSEParser as they arrive from the socket and the
+        first event carrying valid JSON is returned without buffering the
+        rest of the stream; the caller closes the response afterwards.
 
         Args:
-            sse_data: Raw SSE response data
+            response: Streaming HTTP response with an SSE body
 
         Returns:
-            Parsed JSON data from SSE stream
+            Parsed JSON data from SSE stream (a JSON object, or a JSON array
+            for batch responses)
         """
-        lines = sse_data.strip().split('\n')
-        for line in lines:
-            if line.startswith('data: '):
-                data_json = line[6:]  # Remove 'data: ' prefix
-                try:
-                    return json.loads(data_json)
-                except json.JSONDecodeError:
-                    continue
+        parser = _SSEParser()
+        # chunk_size=None yields data as it arrives instead of waiting for
+        # fixed-size reads to fill up
+        bytes_read = 0
+        for chunk in response.iter_content(chunk_size=None):
+            bytes_read += len(chunk)
+            self._check_sse_size(bytes_read)
+            for event in parser.feed(chunk):
+                result = self._parse_sse_event(event)
+                if result is not None:
+                    return result
+
+        for event in parser.close():
+            result = self._parse_sse_event(event)
+            if result is not None:
+                return result
         raise Exception("No valid JSON found in SSE response")
 
     def initialize(self) -> Dict[str, Any]:
@@ -251,21 +930,23 @@ class MCPClient:
         Returns:
             Initialization response
         """
-        payload = {
-            "jsonrpc": "2.0",
-            "id": self._get_next_request_id(),
-            "method": "initialize",
-            "params": {
-                "protocolVersion": "2024-11-05",
-                "capabilities": {},
-                "clientInfo": {
-                    "name": "mcp-utils-client",
-                    "version": "1.0.0"
-                }
-            }
-        }
-
-        result = self._make_request(payload)
+        if self._session_restored and self._restored_init_result is not None:
+            # Handshake already completed by an earlier process
+            logger.debug(f"Reusing cached MCP session {self.session_id}, skipping initialize")
+            self._store_capabilities(self._restored_init_result)
+            return self._restored_init_result
+
+        result = self._make_request_bytes(
+            self._INITIALIZE_TEMPLATE % self._get_next_request_id()
+        )
+        self._store_capabilities(result)
+
+        if self._session_cache_key and self.session_id:
+            _store_cached_session(self._session_cache_key, {
+                "session_id": self.session_id,
+                "established_at": time.time(),
+                "initialize_result": result
+            }, self.session_cache_ttl)
 
         # Send initialized notification to complete handshake
         self._send_initialized()
@@ -273,14 +954,27 @@ class MCPClient:
         return result
 
     def _send_initialized(self) -> None:
-        """Send initialized notification to complete MCP handshake."""
-        payload = {
-            "jsonrpc": "2.0",
-            "method": "notifications/initialized"
-        }
+        """
+        Send initialized notification to complete MCP handshake.
+
+        Notifications have no response, so this is fire-and-forget: the body
+        is never read and a slow server can only stall it for
+        _NOTIFICATION_TIMEOUT seconds.
+        """
         try:
-            self._make_request(payload)
-        except Exception as e:
+            response = self._http.post(
+                self.gateway_url,
+                data=self._INITIALIZED_BYTES,
+                headers=self._build_headers(),
+                timeout=(self.timeout, self._NOTIFICATION_TIMEOUT),
+                stream=True
+            )
+            # Draining an empty body (202 Accepted) is free and keeps the
+            # connection reusable; any other body is dropped unread
+            if response.headers.get('content-length') == '0':
+                response.raw.release_conn()
+            response.close()
+        except requests.exceptions.RequestException as e:
             # This is expected for some MCP servers that don't require the notification
             logger.debug(f"Initialized notification not sent (this is normal): {e}")
 
@@ -291,12 +985,7 @@ class MCPClient:
         Returns:
             Ping response
         """
-        payload = {
-            "jsonrpc": "2.0",
-            "id": self._get_next_request_id(),
-            "method": "ping"
-        }
-        return self._make_request(payload)
+        return self._make_request_bytes(self._PING_TEMPLATE % self._get_next_request_id())
 
     def list_tools(self) -> Dict[str, Any]:
         """
@@ -305,12 +994,7 @@ class MCPClient:
         Returns:
             Tools list response
         """
-        payload = {
-            "jsonrpc": "2.0",
-            "id": self._get_next_request_id(),
-            "method": "tools/list"
-        }
-        return self._make_request(payload)
+        return self._make_request_bytes(self._LIST_TOOLS_TEMPLATE % self._get_next_request_id())
 
     def call_tool(
         self,
@@ -341,15 +1025,7 @@ class MCPClient:
         }
 
         response = self._make_request(payload)
-
-        # Handle MCP response format
-        if "error" in response:
-            raise Exception(f"MCP tool error: {response['error']}")
-
-        if "result" in response:
-            return response["result"]
-
-        return response
+        return self._unwrap_tool_response(response)
 
     def call_mcpgw_tool(
         self,
@@ -368,8 +1044,398 @@ class MCPClient:
         Returns:
             Tool execution result
         """
-        arguments = {"params": params}
-        return self.call_tool(tool_name, arguments)
+        body = self._get_tool_serializer(tool_name)(params, self._get_next_request_id())
+        response = self._make_request_bytes(body)
+        return self._unwrap_tool_response(response)
+
+    def _supports_input_from(self) -> bool:
+        """Check whether the server advertised the batch pipelining extension."""
+        experimental = self.server_capabilities.get("experimental") or {}
+        # Capabilities are objects; an empty one still means supported
+        return INPUT_FROM_PARAM in experimental
+
+    def call_batch(
+        self,
+        calls: List[Union[Call, Tuple[str, Optional[Dict[str, Any]]]]]
+    ) -> List[Dict[str, Any]]:
+        """
+        Send several JSON-RPC requests in a single HTTP round trip.
+
+        Calls that depend on an earlier call's result (Call.depends_on) are
+        sent in the same batch when the server advertises the x-input-from
+        extension, and are otherwise executed sequentially with the value
+        spliced in client-side.
+
+        Args:
+            calls: List of Call objects or (method, params) tuples
+
+        Returns:
+            JSON-RPC responses in the same order as the calls
+        """
+        calls = [call if isinstance(call, Call) else Call(*call) for call in calls]
+        for index, call in enumerate(calls):
+            if call.depends_on is None:
+                continue
+            if not 0 <= call.depends_on < index:
+                raise ValueError(f"Call {index} must depend on an earlier call")
+            if not call.jsonpath or not call.target:
+                raise ValueError(f"Call {index} needs jsonpath and target to use depends_on")
+
+        has_dependencies = any(call.depends_on is not None for call in calls)
+        if has_dependencies and not self._supports_input_from():
+            logger.debug("Server lacks x-input-from support, running dependent calls sequentially")
+            return self._call_sequential(calls)
+
+        payload = [call.to_request(self._get_next_request_id()) for call in calls]
+        response = self._make_request(payload)
+
+        # A server may answer a batch with a single error object
+        if isinstance(response, dict):
+            if "error" in response:
+                raise Exception(f"MCP batch error: {response['error']}")
+            response = [response]
+
+        # JSON-RPC allows batch responses in any order, so match them by id
+        responses_by_id = {item.get("id"): item for item in response}
+        results = []
+        for request in payload:
+            item = responses_by_id.get(request["id"])
+            if item is None:
+                raise Exception(f"No response for batched request id {request['id']}")
+            results.append(item)
+        return results
+
+    def _call_sequential(self, calls: List[Call]) -> List[Dict[str, Any]]:
+        """Run calls one request at a time, resolving dependencies client-side."""
+        results = []
+        for call in calls:
+            params = dict(call.params) if call.params else {}
+            if call.depends_on is not None:
+                value = _select_json_path(results[call.depends_on], call.jsonpath)
+                _set_dotted_key(params, call.target, value)
+            resolved = Call(call.method, params or None)
+            results.append(self._make_request(resolved.to_request(self._get_next_request_id())))
+        return results
+
+    def call_tool_many(
+        self,
+        names_and_args: List[Tuple[str, Dict[str, Any]]]
+    ) -> List[Dict[str, Any]]:
+        """
+        Call several mcpgw tools in a single batched request.
+
+        Parameters are wrapped in the same format as call_mcpgw_tool.
+
+        Args:
+            names_and_args: List of (tool_name, params) tuples
+
+        Returns:
+            Tool execution results in the same order as the calls
+        """
+        calls = [
+            ("tools/call", {"name": tool_name, "arguments": {"params": params}})
+            for tool_name, params in names_and_args
+        ]
+
+        results = []
+        for response in self.call_batch(calls):
+            if "error" in response:
+                raise Exception(f"MCP tool error: {response['error']}")
+            results.append(response.get("result", response))
+        return results
+
+    def close(self) -> None:
+        """
+        Release the pooled HTTP session and end the session locally.
+
+        The connection pool is shared per origin, so its sockets are closed
+        once the last open client for that gateway is closed. The session id
+        persisted on disk is left in place for later processes.
+        """
+        if self._closed:
+            return
+        self._closed = True
+        self.session_id = None
+        self._release_shared_session(self._http_key)
+
+    def __del__(self):
+        """Release sockets of clients that were never closed explicitly."""
+        try:
+            if not getattr(self, '_closed', True):
+                self.close()
+        except Exception:
+            # Interpreter shutdown may have torn down module globals already
+            pass
+
+
+class AsyncMCPClient(_MCPClientBase):
+    """
+    Asynchronous MCP client built on httpx.AsyncClient.
+
+    Independent tool calls can be fanned out with asyncio.gather and share one
+    connection pool; when the h2 package is installed the requests are
+    multiplexed as HTTP/2 streams over a single connection.
+    """
+
+    def __init__(
+        self,
+        gateway_url: str,
+        access_token: Optional[str] = None,
+        backend_token: Optional[str] = None,
+        timeout: int = 30,
+        max_keepalive_connections: int = 8,
+        max_sse_bytes: int = DEFAULT_MAX_SSE_BYTES
+    ):
+        """
+        Initialize async MCP client.
+
+        Args:
+            gateway_url: URL of the MCP gateway endpoint
+            access_token: Optional Bearer token for backend server authentication (Authorization header)
+            backend_token: Optional separate token for backend server (if different from gateway token)
+            timeout: Request timeout in seconds
+            max_keepalive_connections: Maximum idle connections kept in the pool
+            max_sse_bytes: Maximum bytes read from an SSE stream before giving up
+
+        Raises:
+            ImportError: If httpx is not installed
+        """
+        if httpx is None:
+            raise ImportError("httpx is required for AsyncMCPClient: pip install httpx")
+        super().__init__(gateway_url, access_token, backend_token, timeout, max_sse_bytes)
+        self.max_keepalive_connections = max_keepalive_connections
+        self._http: Optional["httpx.AsyncClient"] = None
+
+    async def __aenter__(self) -> "AsyncMCPClient":
+        """Open the pooled HTTP client."""
+        self._get_http_client()
+        return self
+
+    async def __aexit__(self, exc_type, exc_val, exc_tb):
+        """Close the pooled HTTP client."""
+        await self.aclose()
+
+    def _get_http_client(self) -> "httpx.AsyncClient":
+        """Return the pooled HTTP client, creating it on first use."""
+        if self._http is None:
+            self._http = httpx.AsyncClient(
+                http2=_HTTP2_AVAILABLE,
+                headers=self._DEFAULT_HEADERS,
+                timeout=self.timeout,
+                limits=httpx.Limits(max_keepalive_connections=self.max_keepalive_connections)
+            )
+        return self._http
+
+    async def _make_request(
+        self,
+        payload: Union[Dict[str, Any], List[Dict[str, Any]]]
+    ) -> Union[Dict[str, Any], List[Dict[str, Any]]]:
+        """
+        Make HTTP request to MCP gateway.
+
+        Args:
+            payload: JSON-RPC payload, or a list of payloads for a batch request
+
+        Returns:
+            Parsed response data (a list for batch requests)
+
+        Raises:
+            Exception: If request fails or response is invalid
+        """
+        return await self._make_request_bytes(json.dumps(payload).encode('utf-8'))
+
+    async def _make_request_bytes(
+        self,
+        data: bytes
+    ) -> Union[Dict[str, Any], List[Dict[str, Any]]]:
+        """
+        Make HTTP request to MCP gateway with an already encoded JSON-RPC body.
+
+        Args:
+            data: UTF-8 encoded JSON-RPC payload
+
+        Returns:
+            Parsed response data (a list for batch requests)
+
+        Raises:
+            Exception: If request fails or response is invalid
+        """
+        client = self._get_http_client()
+        try:
+            async with client.stream(
+                'POST',
+                self.gateway_url,
+                content=data,
+                headers=self._build_headers()
+            ) as response:
+                if response.is_error:
+                    # Only JSON error bodies carry detail worth reading
+                    is_json = 'json' in response.headers.get('content-type', '')
+                    body = await response.aread() if is_json else None
+                    raise _HTTPStatusError(response.status_code, self._http_error_message(
+                        response.status_code, response.reason_phrase, body
+                    ))
+
+                content_type = response.headers.get('content-type', '')
+                self._update_session_id(response.headers)
+
+                try:
+                    # Handle Server-Sent Events (SSE) response
+                    if 'text/event-stream' in content_type:
+                        return await self._parse_sse_response(response)
+                    else:
+                        # Handle regular JSON response
+                        return json.loads(await response.aread())
+
+                except json.JSONDecodeError as e:
+                    raise Exception(f"Invalid JSON response: {e}")
+
+        except httpx.HTTPError as e:
+            raise Exception(f"Network error: {e}")
+
+    async def _parse_sse_response(
+        self,
+        response: "httpx.Response"
+    ) -> Union[Dict[str, Any], List[Dict[str, Any]]]:
+        """
+        Parse Server-Sent Events response incrementally.
+
+        Args:
+            response: Streaming HTTP response with an SSE body
+
+        Returns:
+            Parsed JSON data from the first SSE event carrying valid JSON
+        """
+        parser = _SSEParser()
+        bytes_read = 0
+        async for chunk in response.aiter_bytes():
+            bytes_read += len(chunk)
+            self._check_sse_size(bytes_read)
+            for event in parser.feed(chunk):
+                result = self._parse_sse_event(event)
+                if result is not None:
+                    return result
+
+        for event in parser.close():
+            result = self._parse_sse_event(event)
+            if result is not None:
+                return result
+        raise Exception("No valid JSON found in SSE response")
+
+    async def initialize(self) -> Dict[str, Any]:
+        """
+        Initialize MCP session with the gateway.
+
+        Returns:
+            Initialization response
+        """
+        result = await self._make_request_bytes(
+            self._INITIALIZE_TEMPLATE % self._get_next_request_id()
+        )
+        self._store_capabilities(result)
+
+        # Send initialized notification to complete handshake
+        await self._send_initialized()
+
+        return result
+
+    async def _send_initialized(self) -> None:
+        """
+        Send initialized notification to complete MCP handshake.
+
+        Fire-and-forget like MCPClient._send_initialized: the body is never
+        read and the wait is capped at _NOTIFICATION_TIMEOUT seconds.
+        """
+        client = self._get_http_client()
+        try:
+            async with client.stream(
+                'POST',
+                self.gateway_url,
+                content=self._INITIALIZED_BYTES,
+                headers=self._build_headers(),
+                timeout=httpx.Timeout(self.timeout, read=self._NOTIFICATION_TIMEOUT)
+            ) as response:
+                # Draining an empty body (202 Accepted) is free and keeps the
+                # connection reusable; any other body is dropped unread
+                if response.headers.get('content-length') == '0':
+                    await response.aread()
+        except httpx.HTTPError as e:
+            # This is expected for some MCP servers that don't require the notification
+            logger.debug(f"Initialized notification not sent (this is normal): {e}")
+
+    async def ping(self) -> Dict[str, Any]:
+        """
+        Test connectivity with ping.
+
+        Returns:
+            Ping response
+        """
+        return await self._make_request_bytes(self._PING_TEMPLATE % self._get_next_request_id())
+
+    async def list_tools(self) -> Dict[str, Any]:
+        """
+        List available tools.
+
+        Returns:
+            Tools list response
+        """
+        return await self._make_request_bytes(self._LIST_TOOLS_TEMPLATE % self._get_next_request_id())
+
+    async def call_tool(
+        self,
+        tool_name: str,
+        arguments: Optional[Dict[str, Any]] = None
+    ) -> Dict[str, Any]:
+        """
+        Call a specific tool.
+
+        Args:
+            tool_name: Name of the tool to call
+            arguments: Tool arguments (optional)
+
+        Returns:
+            Tool execution result
+        """
+        if arguments is None:
+            arguments = {}
+
+        payload = {
+            "jsonrpc": "2.0",
+            "id": self._get_next_request_id(),
+            "method": "tools/call",
+            "params": {
+                "name": tool_name,
+                "arguments": arguments
+            }
+        }
+
+        response = await self._make_request(payload)
+        return self._unwrap_tool_response(response)
+
+    async def call_mcpgw_tool(
+        self,
+        tool_name: str,
+        params: Dict[str, Any]
+    ) -> Dict[str, Any]:
+        """
+        Call a tool using mcpgw-specific parameter format.
+
+        Args:
+            tool_name: Name of the tool to call
+            params: Parameters for the tool
+
+        Returns:
+            Tool execution result
+        """
+        body = self._get_tool_serializer(tool_name)(params, self._get_next_request_id())
+        response = await self._make_request_bytes(body)
+        return self._unwrap_tool_response(response)
+
+    async def aclose(self) -> None:
+        """Close the pooled HTTP client and release its connections."""
+        if self._http is not None:
+            await self._http.aclose()
+            self._http = None
 
 
 class MCPSession:
@@ -403,14 +1469,52 @@ class MCPSession:
 
     def __exit__(self, exc_type, exc_val, exc_tb):
         """Exit session context."""
+        self.client.close()
         if self._initialized:
             logger.debug("MCP session closed")
 
 
+class AsyncMCPSession:
+    """
+    Async context manager for MCP client sessions.
+
+    Initializes the session on entry and closes the pooled HTTP client on exit.
+    """
+
+    def __init__(self, client: AsyncMCPClient):
+        """
+        Initialize session context.
+
+        Args:
+            client: Async MCP client instance
+        """
+        self.client = client
+        self._initialized = False
+
+    async def __aenter__(self) -> AsyncMCPClient:
+        """Enter session context and initialize."""
+        try:
+            await self.client.initialize()
+            self._initialized = True
+            logger.debug("Async MCP session initialized successfully")
+        except Exception as e:
+            await self.client.aclose()
+            logger.error(f"Failed to initialize MCP session: {e}")
+            raise
+        return self.client
+
+    async def __aexit__(self, exc_type, exc_val, exc_tb):
+        """Exit session context."""
+        await self.client.aclose()
+        if self._initialized:
+            logger.debug("Async MCP session closed")
+
+
 def create_mcp_client(
     gateway_url: str,
     access_token: Optional[str] = None,
-    timeout: int = 30
+    timeout: int = 30,
+    session_cache_ttl: int = 0
 ) -> MCPClient:
     """
     Create and return a configured MCP client.
@@ -419,17 +1523,20 @@ def create_mcp_client(
         gateway_url: URL of the MCP gateway endpoint
         access_token: Optional Bearer token for authentication
         timeout: Request timeout in seconds
+        session_cache_ttl: Seconds a cached session id may be reused by later
+            processes; 0 (the default) disables the session cache
 
     Returns:
         Configured MCP client instance
     """
-    return MCPClient(gateway_url, access_token, timeout)
+    return MCPClient(gateway_url, access_token, timeout=timeout, session_cache_ttl=session_cache_ttl)
 
 
 def create_mcp_session(
     gateway_url: str,
     access_token: Optional[str] = None,
-    timeout: int = 30
+    timeout: int = 30,
+    session_cache_ttl: int = 0
 ) -> MCPSession:
     """
     Create and return an MCP session context manager.
@@ -438,9 +1545,31 @@ def create_mcp_session(
         gateway_url: URL of the MCP gateway endpoint
         access_token: Optional Bearer token for authentication
         timeout: Request timeout in seconds
+        session_cache_ttl: Seconds a cached session id may be reused by later
+            processes; 0 (the default) disables the session cache
 
     Returns:
         MCP session context manager
     """
-    client = create_mcp_client(gateway_url, access_token, timeout)
-    return MCPSession(client)
\ No newline at end of file
+    client = create_mcp_client(gateway_url, access_token, timeout, session_cache_ttl)
+    return MCPSession(client)
+
+
+def create_async_mcp_session(
+    gateway_url: str,
+    access_token: Optional[str] = None,
+    timeout: int = 30
+) -> AsyncMCPSession:
+    """
+    Create and return an async MCP session context manager.
+
+    Args:
+        gateway_url: URL of the MCP gateway endpoint
+        access_token: Optional Bearer token for authentication
+        timeout: Request timeout in seconds
+
+    Returns:
+        Async MCP session context manager
+    """
+    client = AsyncMCPClient(gateway_url, access_token, timeout=timeout)
+    return AsyncMCPSession(client)
\ No newline at end of file
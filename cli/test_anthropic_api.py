@@ -10,23 +10,28 @@ Usage:
     uv run python cli/test_anthropic_api.py --token-file .oauth-tokens/ingress.json --base-url http://localhost
     uv run python cli/test_anthropic_api.py --token-file .oauth-tokens/ingress.json --test list-servers
     uv run python cli/test_anthropic_api.py --token-file .oauth-tokens/ingress.json --test get-server --server-name io.mcpgateway/atlassian
+    uv run python cli/test_anthropic_api.py --token-env MCP_TOKEN_JSON
+    uv run python cli/test_anthropic_api.py --token-fd 3 3< .oauth-tokens/ingress.json
 
 Note: Tokens have a short lifetime for security. If your token expires, generate a new one
 from the UI or ask your administrator to increase the access token timeout in Keycloak.
 """
 
 import argparse
-import base64
+import asyncio
 import json
 import logging
 import os
 import sys
-import time
 from datetime import datetime, timezone
 from pathlib import Path
-from typing import Dict, Any, Optional
+from typing import Dict, Any, Optional, Union
+from urllib.parse import quote
 
+import httpx
 import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 
 # Add project root to path to import constants
 SCRIPT_DIR = Path(__file__).parent
@@ -34,6 +39,7 @@ PROJECT_ROOT = SCRIPT_DIR.parent
 sys.path.insert(0, str(PROJECT_ROOT))
 
 from registry.constants import REGISTRY_CONSTANTS
+from mcp_utils import decode_jwt_payload
 
 
 logging.basicConfig(
@@ -44,6 +50,42 @@ logger = logging.getLogger(__name__)
 
 
 DEFAULT_BASE_URL: str = "http://localhost"
+DEFAULT_TEST_SERVER: str = "io.mcpgateway/atlassian"
+
+_SEP: str = "=" * 80
+
+try:
+    import h2  # noqa: F401
+    _HTTP2_AVAILABLE = True
+except ImportError:
+    _HTTP2_AVAILABLE = False
+
+
+def _create_http_session() -> requests.Session:
+    """
+    Create a pooled HTTP session shared by all API test calls.
+
+    Returns:
+        requests.Session with keep-alive pooling and retries on gateway errors
+    """
+    session = requests.Session()
+    adapter = HTTPAdapter(
+        pool_connections=4,
+        pool_maxsize=10,
+        max_retries=Retry(
+            total=2,
+            backoff_factor=0.2,
+            status_forcelist=[502, 503, 504],
+            raise_on_status=False
+        )
+    )
+    session.mount("http://", adapter)
+    session.mount("https://", adapter)
+    session.headers["Content-Type"] = "application/json"
+    return session
+
+
+_SESSION: requests.Session = _create_http_session()
 
 
 def _check_token_expiration(
@@ -60,21 +102,12 @@ def _check_token_expiration(
     """
     try:
         # Decode JWT payload (without verification, just to check expiry)
-        parts = access_token.split('.')
-        if len(parts) != 3:
+        try:
+            token_data = decode_jwt_payload(access_token)
+        except ValueError:
             logger.warning("Invalid JWT format, cannot check expiration")
             return
 
-        # Decode payload
-        payload = parts[1]
-        # Add padding if needed
-        padding = len(payload) % 4
-        if padding:
-            payload += '=' * (4 - padding)
-
-        decoded = base64.urlsafe_b64decode(payload)
-        token_data = json.loads(decoded)
-
         # Check expiration
         exp = token_data.get('exp')
         if not exp:
@@ -87,16 +120,16 @@ def _check_token_expiration(
 
         if time_until_expiry.total_seconds() < 0:
             # Token is expired
-            logger.error("=" * 80)
+            logger.error(_SEP)
             logger.error("TOKEN EXPIRED")
-            logger.error("=" * 80)
+            logger.error(_SEP)
             logger.error(f"Token expired at: {exp_dt.strftime('%Y-%m-%d %H:%M:%S UTC')}")
             logger.error(f"Current time is: {now.strftime('%Y-%m-%d %H:%M:%S UTC')}")
             logger.error(f"Token expired {abs(time_until_expiry.total_seconds())} seconds ago")
             logger.error("")
             logger.error("Please regenerate your token:")
             logger.error("  ./credentials-provider/generate_creds.sh")
-            logger.error("=" * 80)
+            logger.error(_SEP)
             sys.exit(1)
         elif time_until_expiry.total_seconds() < 60:
             # Token expires soon
@@ -130,6 +163,29 @@ def _load_token_file(
         sys.exit(1)
 
 
+def _load_token_source(
+    source: str,
+    content: Union[bytes, str]
+) -> Dict[str, Any]:
+    """
+    Parse token data read from a file descriptor or environment variable.
+
+    Args:
+        source: Description of where the data came from, for messages
+        content: Raw token JSON
+
+    Returns:
+        Token data dictionary
+    """
+    try:
+        token_data = json.loads(content)
+    except json.JSONDecodeError as e:
+        logger.error(f"Failed to parse token data from {source}: {e}")
+        sys.exit(1)
+    logger.info(f"Loaded token data from {source}")
+    return token_data
+
+
 def _save_token_file(
     token_file_path: Path,
     token_data: Dict[str, Any]
@@ -149,6 +205,14 @@ def _save_token_file(
         logger.error(f"Failed to save token file: {e}")
 
 
+def _get_access_token(
+    token_data: Dict[str, Any]
+) -> Optional[str]:
+    """Return the access token from either token file layout."""
+    if "tokens" in token_data:
+        return token_data["tokens"].get("access_token")
+    return token_data.get("access_token")
+
 
 def _make_api_request(
     endpoint: str,
@@ -172,17 +236,12 @@ def _make_api_request(
     """
     url = f"{base_url}{endpoint}"
 
-    headers = {
-        "X-Authorization": f"Bearer {access_token}",
-        "Content-Type": "application/json"
-    }
-
     try:
         logger.info(f"Making {method} request to: {url}")
-        response = requests.request(
+        response = _SESSION.request(
             method=method,
             url=url,
-            headers=headers,
+            headers={"X-Authorization": f"Bearer {access_token}"},
             params=params,
             timeout=10
         )
@@ -202,6 +261,81 @@ def _make_api_request(
         return None
 
 
+async def _amake_api_request(
+    client: httpx.AsyncClient,
+    endpoint: str,
+    params: Optional[Dict[str, Any]] = None
+) -> Optional[Dict[str, Any]]:
+    """
+    Make an async GET request to the Anthropic MCP Registry API.
+
+    Args:
+        client: AsyncClient configured with base URL and auth headers
+        endpoint: API endpoint (e.g., /{ANTHROPIC_API_VERSION}/servers)
+        params: Query parameters
+
+    Returns:
+        Response JSON or None if request fails
+    """
+    try:
+        logger.info(f"Making GET request to: {client.base_url}{endpoint}")
+        response = await client.get(endpoint, params=params)
+
+        if response.status_code == 401:
+            logger.warning("Received 401 Unauthorized - token may be expired")
+            return None
+
+        response.raise_for_status()
+        return response.json()
+
+    except httpx.HTTPStatusError as e:
+        logger.error(f"API request failed: {e}")
+        logger.error(f"Response status: {e.response.status_code}")
+        logger.error(f"Response body: {e.response.text}")
+        return None
+    except httpx.HTTPError as e:
+        logger.error(f"API request failed: {e}")
+        return None
+
+
+def _servers_endpoint() -> str:
+    """Return the list servers endpoint."""
+    return f"/{REGISTRY_CONSTANTS.ANTHROPIC_API_VERSION}/servers"
+
+
+def _server_versions_endpoint(
+    server_name: str
+) -> str:
+    """Return the versions endpoint for a server."""
+    encoded_name = quote(server_name, safe='')
+    return f"{_servers_endpoint()}/{encoded_name}/versions"
+
+
+def _server_version_details_endpoint(
+    server_name: str,
+    version: str
+) -> str:
+    """Return the version details endpoint for a server."""
+    return f"{_server_versions_endpoint(server_name)}/{quote(version, safe='')}"
+
+
+def _print_response(
+    title: str,
+    result: Dict[str, Any]
+) -> None:
+    """
+    Print an API response framed by separator lines.
+
+    Args:
+        title: Heading printed above the response
+        result: Response JSON
+    """
+    sys.stdout.write(
+        f"\n{_SEP}\n{title}\n{_SEP}\n{json.dumps(result, indent=2)}\n{_SEP}\n\n"
+    )
+    sys.stdout.flush()
+
+
 def _test_list_servers(
     access_token: str,
     base_url: str,
@@ -218,18 +352,20 @@ def _test_list_servers(
     logger.info(f"Testing: List servers (limit={limit})")
 
     result = _make_api_request(
-        endpoint=f"/{REGISTRY_CONSTANTS.ANTHROPIC_API_VERSION}/servers",
+        endpoint=_servers_endpoint(),
         access_token=access_token,
         base_url=base_url,
         params={"limit": limit}
     )
+    _report_list_servers(result)
 
+
+def _report_list_servers(
+    result: Optional[Dict[str, Any]]
+) -> None:
+    """Print the list servers response or log the failure."""
     if result:
-        print("\n" + "=" * 80)
-        print("LIST SERVERS RESPONSE:")
-        print("=" * 80)
-        print(json.dumps(result, indent=2))
-        print("=" * 80 + "\n")
+        _print_response("LIST SERVERS RESPONSE:", result)
 
         servers = result.get("servers", [])
         logger.info(f"Found {len(servers)} servers")
@@ -252,21 +388,21 @@ def _test_get_server_versions(
     """
     logger.info(f"Testing: Get server versions for {server_name}")
 
-    encoded_name = server_name.replace("/", "%2F")
-    endpoint = f"/{REGISTRY_CONSTANTS.ANTHROPIC_API_VERSION}/servers/{encoded_name}/versions"
-
     result = _make_api_request(
-        endpoint=endpoint,
+        endpoint=_server_versions_endpoint(server_name),
         access_token=access_token,
         base_url=base_url
     )
+    _report_server_versions(server_name, result)
+
 
+def _report_server_versions(
+    server_name: str,
+    result: Optional[Dict[str, Any]]
+) -> None:
+    """Print the server versions response or log the failure."""
     if result:
-        print("\n" + "=" * 80)
-        print(f"SERVER VERSIONS RESPONSE: {server_name}")
-        print("=" * 80)
-        print(json.dumps(result, indent=2))
-        print("=" * 80 + "\n")
+        _print_response(f"SERVER VERSIONS RESPONSE: {server_name}", result)
     else:
         logger.error(f"Failed to get versions for {server_name}")
 
@@ -288,31 +424,34 @@ def _test_get_server_version_details(
     """
     logger.info(f"Testing: Get server version details for {server_name} v{version}")
 
-    encoded_name = server_name.replace("/", "%2F")
-    endpoint = f"/{REGISTRY_CONSTANTS.ANTHROPIC_API_VERSION}/servers/{encoded_name}/versions/{version}"
-
     result = _make_api_request(
-        endpoint=endpoint,
+        endpoint=_server_version_details_endpoint(server_name, version),
         access_token=access_token,
         base_url=base_url
     )
+    _report_server_version_details(server_name, version, result)
+
 
+def _report_server_version_details(
+    server_name: str,
+    version: str,
+    result: Optional[Dict[str, Any]]
+) -> None:
+    """Print the server version details response or log the failure."""
     if result:
-        print("\n" + "=" * 80)
-        print(f"SERVER VERSION DETAILS: {server_name} v{version}")
-        print("=" * 80)
-        print(json.dumps(result, indent=2))
-        print("=" * 80 + "\n")
+        _print_response(f"SERVER VERSION DETAILS: {server_name} v{version}", result)
     else:
         logger.error(f"Failed to get version details for {server_name}")
 
 
-def _run_all_tests(
+async def _run_all_tests_async(
     access_token: str,
     base_url: str
 ) -> None:
     """
-    Run all API tests.
+    Run all API tests concurrently over one pooled client.
+
+    Responses are printed in a fixed order once all requests complete.
 
     Args:
         access_token: JWT access token
@@ -320,26 +459,45 @@ def _run_all_tests(
     """
     logger.info("Running all API tests...")
 
-    _test_list_servers(access_token, base_url, limit=10)
+    headers = {
+        "X-Authorization": f"Bearer {access_token}",
+        "Content-Type": "application/json"
+    }
 
-    time.sleep(1)
+    async with httpx.AsyncClient(
+        base_url=base_url,
+        headers=headers,
+        http2=_HTTP2_AVAILABLE,
+        timeout=10
+    ) as client:
+        servers, versions, details = await asyncio.gather(
+            _amake_api_request(client, _servers_endpoint(), params={"limit": 10}),
+            _amake_api_request(client, _server_versions_endpoint(DEFAULT_TEST_SERVER)),
+            _amake_api_request(
+                client,
+                _server_version_details_endpoint(DEFAULT_TEST_SERVER, "latest")
+            )
+        )
 
-    _test_get_server_versions(
-        access_token,
-        base_url,
-        "io.mcpgateway/atlassian"
-    )
+    _report_list_servers(servers)
+    _report_server_versions(DEFAULT_TEST_SERVER, versions)
+    _report_server_version_details(DEFAULT_TEST_SERVER, "latest", details)
 
-    time.sleep(1)
+    logger.info("All tests completed")
 
-    _test_get_server_version_details(
-        access_token,
-        base_url,
-        "io.mcpgateway/atlassian",
-        "latest"
-    )
 
-    logger.info("All tests completed")
+def _run_all_tests(
+    access_token: str,
+    base_url: str
+) -> None:
+    """
+    Run all API tests.
+
+    Args:
+        access_token: JWT access token
+        base_url: Base URL for the API
+    """
+    asyncio.run(_run_all_tests_async(access_token, base_url))
 
 
 def main():
@@ -361,18 +519,36 @@ Examples:
     # Custom base URL
     uv run python cli/test_anthropic_api.py --token-file .oauth-tokens/ingress.json --base-url https://mcpgateway.ddns.net
 
+    # Read token JSON from an environment variable or inherited file descriptor
+    uv run python cli/test_anthropic_api.py --token-env MCP_TOKEN_JSON
+    uv run python cli/test_anthropic_api.py --token-fd 3 3< .oauth-tokens/ingress.json
+
 Note: If your token expires, generate a new one from the UI. Administrators can increase
 token lifetime in Keycloak: Realm Settings → Tokens → Access Token Lifespan
 """
     )
 
-    parser.add_argument(
+    token_source = parser.add_mutually_exclusive_group(required=True)
+
+    token_source.add_argument(
         "--token-file",
         type=str,
-        required=True,
         help="Path to token JSON file (e.g., .oauth-tokens/mcp-registry-api-tokens-2025-10-12.json)"
     )
 
+    token_source.add_argument(
+        "--token-fd",
+        type=int,
+        help="Read token JSON from this already-open file descriptor"
+    )
+
+    token_source.add_argument(
+        "--token-env",
+        type=str,
+        metavar="VAR",
+        help="Read token JSON from this environment variable"
+    )
+
     parser.add_argument(
         "--base-url",
         type=str,
@@ -413,23 +589,35 @@ token lifetime in Keycloak: Realm Settings → Tokens → Access Token Lifespan
     if args.debug:
         logging.getLogger().setLevel(logging.DEBUG)
 
-    logger.info("=" * 80)
+    logger.info(_SEP)
     logger.info(f"Anthropic MCP Registry API {REGISTRY_CONSTANTS.ANTHROPIC_API_VERSION} Test Tool")
-    logger.info("=" * 80)
-
-    token_file_path = Path(args.token_file)
-    if not token_file_path.exists():
-        logger.error(f"Token file not found: {token_file_path}")
-        sys.exit(1)
+    logger.info(_SEP)
+
+    if args.token_fd is not None:
+        try:
+            with os.fdopen(args.token_fd, 'rb') as f:
+                content = f.read()
+        except OSError as e:
+            logger.error(f"Failed to read token file descriptor {args.token_fd}: {e}")
+            sys.exit(1)
+        token_data = _load_token_source(f"file descriptor {args.token_fd}", content)
+    elif args.token_env:
+        if args.token_env not in os.environ:
+            logger.error(f"Environment variable not set: {args.token_env}")
+            sys.exit(1)
+        token_data = _load_token_source(
+            f"environment variable {args.token_env}",
+            os.environ[args.token_env]
+        )
+    else:
+        token_file_path = Path(args.token_file)
+        if not token_file_path.exists():
+            logger.error(f"Token file not found: {token_file_path}")
+            sys.exit(1)
 
-    token_data = _load_token_file(token_file_path)
+        token_data = _load_token_file(token_file_path)
 
-    access_token = None
-
-    if "tokens" in token_data:
-        access_token = token_data["tokens"].get("access_token")
-    else:
-        access_token = token_data.get("access_token")
+    access_token = _get_access_token(token_data)
 
     if not access_token:
         logger.error("No access_token found in token file")
@@ -444,12 +632,20 @@ token lifetime in Keycloak: Realm Settings → Tokens → Access Token Lifespan
     if args.test == "all":
         _run_all_tests(access_token, args.base_url)
     elif args.test == "list-servers":
-        _test_list_servers(access_token, args.base_url, args.limit)
+        _test_list_servers(
+            access_token,
+            args.base_url,
+            args.limit
+        )
     elif args.test == "get-versions":
         if not args.server_name:
             logger.error("--server-name required for get-versions test")
             sys.exit(1)
-        _test_get_server_versions(access_token, args.base_url, args.server_name)
+        _test_get_server_versions(
+            access_token,
+            args.base_url,
+            args.server_name
+        )
     elif args.test == "get-server":
         if not args.server_name:
             logger.error("--server-name required for get-server test")
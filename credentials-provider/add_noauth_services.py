@@ -5,15 +5,19 @@ Add No-Auth Services to MCP Configuration
 This script scans the registry/servers JSON files and adds services with
 auth_type: "none" to the MCP configuration files (vscode_mcp.json and mcp.json).
 These services only require ingress authentication headers for access.
+
+The ingress headers dict is built once and treated as immutable afterwards;
+every server entry references it directly rather than holding a copy.
 """
 
 import argparse
+import functools
 import json
 import logging
 import os
 import sys
 from pathlib import Path
-from typing import Dict, List, Any, Optional
+from typing import Dict, FrozenSet, List, Any, Optional, Tuple
 
 # Configure logging
 logging.basicConfig(
@@ -23,13 +27,20 @@ logging.basicConfig(
 
 logger = logging.getLogger(__name__)
 
+# Project layout, resolved once at import
+SCRIPT_DIR = Path(__file__).parent
+PROJECT_ROOT = SCRIPT_DIR.parent
+ENV_FILE = PROJECT_ROOT / ".env"
+REGISTRY_SERVERS_DIR = PROJECT_ROOT / "registry" / "servers"
+OAUTH_TOKENS_DIR = PROJECT_ROOT / ".oauth-tokens"
+
+# Servers whose endpoint is served at the path itself rather than {path}/mcp
+_NO_MCP_SUFFIX: FrozenSet[str] = frozenset({"/atlassian"})
+
 
 def _load_env_file() -> None:
     """Load environment variables from .env file in project root."""
-    # Get the project root directory (parent of credentials-provider)
-    script_dir = Path(__file__).parent
-    project_root = script_dir.parent
-    env_file = project_root / ".env"
+    env_file = ENV_FILE
 
     if env_file.exists():
         try:
@@ -38,8 +49,11 @@ def _load_env_file() -> None:
                     line = line.strip()
                     if line and not line.startswith('#') and '=' in line:
                         key, value = line.split('=', 1)
+                        key = key.strip()
+                        if key.startswith('export '):
+                            key = key[len('export '):].strip()
                         # Remove quotes if present
-                        value = value.strip('"').strip("'")
+                        value = value.strip().strip('"').strip("'")
                         os.environ[key] = value
             logger.debug(f"Loaded environment variables from {env_file}")
         except Exception as e:
@@ -65,9 +79,12 @@ def _save_json_file(
 ) -> None:
     """Save data to JSON file safely."""
     try:
-        with open(file_path, 'w', encoding='utf-8') as f:
+        # Create with 0600 so the file is never briefly world-readable; fchmod
+        # tightens files that already existed with looser permissions
+        fd = os.open(file_path, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o600)
+        os.fchmod(fd, 0o600)
+        with os.fdopen(fd, 'w', encoding='utf-8') as f:
             json.dump(data, f, indent=2, ensure_ascii=False)
-        os.chmod(file_path, 0o600)
         logger.info(f"✅ Updated {description}: {file_path}")
     except Exception as e:
         logger.error(f"Failed to save {description} to {file_path}: {e}")
@@ -75,8 +92,7 @@ def _save_json_file(
 
 def _get_registry_servers_dir() -> Path:
     """Get the path to the registry servers directory."""
-    script_dir = Path(__file__).parent
-    registry_dir = script_dir.parent / "registry" / "servers"
+    registry_dir = REGISTRY_SERVERS_DIR
     
     if not registry_dir.exists():
         raise FileNotFoundError(f"Registry servers directory not found: {registry_dir}")
@@ -86,12 +102,13 @@ def _get_registry_servers_dir() -> Path:
 
 def _get_oauth_tokens_dir() -> Path:
     """Get the path to the oauth tokens directory."""
-    script_dir = Path(__file__).parent
-    tokens_dir = script_dir.parent / ".oauth-tokens"
+    tokens_dir = OAUTH_TOKENS_DIR
     
-    if not tokens_dir.exists():
+    try:
         tokens_dir.mkdir(mode=0o700, parents=True)
         logger.info(f"Created oauth tokens directory: {tokens_dir}")
+    except FileExistsError:
+        pass
     
     return tokens_dir
 
@@ -129,8 +146,48 @@ def _scan_noauth_services() -> List[Dict[str, Any]]:
     return noauth_services
 
 
+def _build_service_url(
+    registry_url: str,
+    path: str
+) -> str:
+    """Build the gateway URL for a service path (handle trailing slashes properly)."""
+    path = path.rstrip("/")
+    if path in _NO_MCP_SUFFIX:
+        return f"{registry_url}{path}"
+    return f"{registry_url}{path}/mcp"
+
+
+def _prepare_services(
+    noauth_services: List[Dict[str, Any]],
+    registry_url: str
+) -> List[Tuple[str, str, Dict[str, Any]]]:
+    """
+    Resolve the config key and gateway URL for each service once.
+
+    Services whose path has no name (e.g. "/") are dropped.
+
+    Returns:
+        (server_key, service_url, service) tuples shared by both config writers
+    """
+    prepared_services = []
+    for service in noauth_services:
+        # Use path as server key (remove leading and trailing slashes)
+        server_key = service["path"].strip("/")
+        if not server_key:
+            continue
+        service_url = _build_service_url(registry_url, service["path"])
+        prepared_services.append((server_key, service_url, service))
+    return prepared_services
+
+
+@functools.cache
 def _get_ingress_headers() -> Optional[Dict[str, str]]:
-    """Get ingress authentication headers from tokens file."""
+    """
+    Get ingress authentication headers from tokens file.
+
+    Cached for the life of the process, so call it only after the .env file
+    has been loaded (AUTH_PROVIDER selects the token source).
+    """
     tokens_dir = _get_oauth_tokens_dir()
     ingress_file = tokens_dir / "ingress.json"
 
@@ -174,7 +231,7 @@ def _get_ingress_headers() -> Optional[Dict[str, str]]:
 
 
 def _update_vscode_config(
-    noauth_services: List[Dict[str, Any]], 
+    prepared_services: List[Tuple[str, str, Dict[str, Any]]],
     ingress_headers: Optional[Dict[str, str]]
 ) -> None:
     """Update VS Code MCP configuration with no-auth services."""
@@ -190,24 +247,8 @@ def _update_vscode_config(
     if "servers" not in config["mcp"]:
         config["mcp"]["servers"] = {}
     
-    registry_url = os.environ.get("REGISTRY_URL", "https://mcpgateway.ddns.net")
-    
     # Add no-auth services
-    for service in noauth_services:
-        # Use path as server key (remove leading and trailing slashes)
-        server_key = service["path"].strip("/")
-        if not server_key:
-            continue
-            
-        # Construct service URL (handle trailing slashes properly)
-        path = service["path"].rstrip("/")
-        # Check if this server should skip the /mcp suffix (e.g., atlassian)
-        servers_no_mcp_suffix = ["/atlassian"]
-        if path in servers_no_mcp_suffix:
-            service_url = f"{registry_url}{path}"
-        else:
-            service_url = f"{registry_url}{path}/mcp"
-        
+    for server_key, service_url, _ in prepared_services:
         # Create server configuration
         server_config = {
             "url": service_url
@@ -215,7 +256,7 @@ def _update_vscode_config(
         
         # Add headers if ingress auth is available
         if ingress_headers:
-            server_config["headers"] = ingress_headers.copy()
+            server_config["headers"] = ingress_headers
         
         config["mcp"]["servers"][server_key] = server_config
         logger.info(f"Added {server_key} to VS Code config: {service_url}")
@@ -224,7 +265,7 @@ def _update_vscode_config(
 
 
 def _update_roocode_config(
-    noauth_services: List[Dict[str, Any]], 
+    prepared_services: List[Tuple[str, str, Dict[str, Any]]],
     ingress_headers: Optional[Dict[str, str]]
 ) -> None:
     """Update Roocode MCP configuration with no-auth services."""
@@ -238,24 +279,8 @@ def _update_roocode_config(
     if "mcpServers" not in config:
         config["mcpServers"] = {}
     
-    registry_url = os.environ.get("REGISTRY_URL", "https://mcpgateway.ddns.net")
-    
     # Add no-auth services
-    for service in noauth_services:
-        # Use path as server key (remove leading and trailing slashes)
-        server_key = service["path"].strip("/")
-        if not server_key:
-            continue
-            
-        # Construct service URL (handle trailing slashes properly)
-        path = service["path"].rstrip("/")
-        # Check if this server should skip the /mcp suffix (e.g., atlassian)
-        servers_no_mcp_suffix = ["/atlassian"]
-        if path in servers_no_mcp_suffix:
-            service_url = f"{registry_url}{path}"
-        else:
-            service_url = f"{registry_url}{path}/mcp"
-        
+    for server_key, service_url, service in prepared_services:
         # Determine transport type
         supported_transports = service.get("supported_transports", ["streamable-http"])
         transport_type = supported_transports[0] if supported_transports else "streamable-http"
@@ -270,7 +295,7 @@ def _update_roocode_config(
         
         # Add headers if ingress auth is available
         if ingress_headers:
-            server_config["headers"] = ingress_headers.copy()
+            server_config["headers"] = ingress_headers
         
         config["mcpServers"][server_key] = server_config
         logger.info(f"Added {server_key} to Roocode config: {service_url} ({transport_type})")
@@ -328,8 +353,11 @@ def main() -> None:
             logger.warning("No ingress authentication available - services will have no headers")
         
         # Update both MCP configuration files
-        _update_vscode_config(noauth_services, ingress_headers)
-        _update_roocode_config(noauth_services, ingress_headers)
+        registry_url = os.environ.get("REGISTRY_URL", "https://mcpgateway.ddns.net")
+        prepared_services = _prepare_services(noauth_services, registry_url)
+
+        _update_vscode_config(prepared_services, ingress_headers)
+        _update_roocode_config(prepared_services, ingress_headers)
         
         logger.info("✅ Successfully updated MCP configurations with no-auth services")
         
@@ -21,15 +21,17 @@ Usage:
 """
 
 import argparse
+import asyncio
 import json
 import logging
 import os
 import time
+from collections import defaultdict
 from datetime import datetime, timezone
 from pathlib import Path
 from typing import Any, Dict, List, Optional, Tuple
 
-import requests
+import httpx
 from dotenv import load_dotenv
 
 # Configure logging with basicConfig
@@ -40,6 +42,55 @@ logging.basicConfig(
 
 logger = logging.getLogger(__name__)
 
+# httpx logs every request at INFO; only show it with --debug
+logging.getLogger("httpx").setLevel(logging.WARNING)
+
+# Upper bound on concurrent connections to the OAuth domain for --all
+MAX_TOKEN_CONNECTIONS: int = 32
+
+# Transient OAuth endpoint failures are retried with exponential backoff
+_RETRY_STATUS_CODES = frozenset({429, 500, 502, 503, 504})
+_MAX_RETRIES: int = 3
+_RETRY_BACKOFF_FACTOR: float = 0.3
+
+try:
+    import h2  # noqa: F401
+    _HTTP2_AVAILABLE = True
+except ImportError:
+    _HTTP2_AVAILABLE = False
+
+_UTC = timezone.utc
+
+# Reuse an on-disk egress token only if it stays valid this much longer
+DEFAULT_REFRESH_SKEW_SECONDS: int = 300
+
+# .env is loaded once per process; per-gateway variables are snapshotted then
+_ENV_LOADED: bool = False
+_AGENTCORE_ENV: Dict[str, str] = {}
+
+# Per-gateway settings, read from AGENTCORE_{FIELD}_{N}
+_GATEWAY_CONFIG_FIELDS = frozenset({"CLIENT_ID", "CLIENT_SECRET", "GATEWAY_ARN", "SERVER_NAME"})
+
+
+def _load_env() -> Dict[str, str]:
+    """
+    Load the .env file on first use and snapshot AGENTCORE_* variables.
+
+    Later calls return the snapshot without re-reading .env or os.environ.
+
+    Returns:
+        Mapping of AGENTCORE_* environment variable names to values
+    """
+    global _ENV_LOADED
+    if not _ENV_LOADED:
+        load_dotenv()
+        _AGENTCORE_ENV.update(
+            (key, value) for key, value in os.environ.items()
+            if key.startswith("AGENTCORE_")
+        )
+        _ENV_LOADED = True
+    return _AGENTCORE_ENV
+
 
 def _load_gateway_configs() -> List[Dict[str, Any]]:
     """
@@ -51,12 +102,21 @@ def _load_gateway_configs() -> List[Dict[str, Any]]:
     """
     configs = []
 
-    # Check for numbered configurations (up to 100)
-    for i in range(1, 101):
-        client_id = os.environ.get(f"AGENTCORE_CLIENT_ID_{i}")
-        client_secret = os.environ.get(f"AGENTCORE_CLIENT_SECRET_{i}")
-        gateway_arn = os.environ.get(f"AGENTCORE_GATEWAY_ARN_{i}")
-        server_name = os.environ.get(f"AGENTCORE_SERVER_NAME_{i}")
+    # Bucket AGENTCORE_{FIELD}_{N} variables by index in a single pass
+    fields_by_index: Dict[int, Dict[str, str]] = defaultdict(dict)
+    for key, value in _load_env().items():
+        name, _, suffix = key.rpartition("_")
+        field = name[len("AGENTCORE_"):]
+        # Only canonical positive indices; _01 or _0 must not shadow _1
+        if suffix.isdigit() and suffix[0] != "0" and field in _GATEWAY_CONFIG_FIELDS:
+            fields_by_index[int(suffix)][field] = value
+
+    for i in sorted(fields_by_index):
+        fields = fields_by_index[i]
+        client_id = fields.get("CLIENT_ID")
+        client_secret = fields.get("CLIENT_SECRET")
+        gateway_arn = fields.get("GATEWAY_ARN")
+        server_name = fields.get("SERVER_NAME")
 
         # If we find a configuration set, add it
         if client_id and client_secret:
@@ -68,10 +128,10 @@ def _load_gateway_configs() -> List[Dict[str, Any]]:
                 "index": i
             }
             configs.append(config)
-            logger.debug(f"Found gateway configuration #{i}: {server_name or 'unnamed'}")
+            logger.debug("Found gateway configuration #%d: %s", i, server_name or 'unnamed')
         elif any([client_id, client_secret, gateway_arn, server_name]):
             # Partial configuration found - warn user
-            logger.warning(f"Incomplete configuration set #{i} - skipping")
+            logger.warning("Incomplete configuration set #%d - skipping", i)
 
     return configs
 
@@ -89,98 +149,295 @@ def _extract_cognito_region_from_pool_id(user_pool_id: str) -> str:
     try:
         return user_pool_id.split("_")[0]
     except (IndexError, AttributeError):
-        logger.error(f"Invalid User Pool ID format: {user_pool_id}")
+        logger.error("Invalid User Pool ID format: %s", user_pool_id)
         raise ValueError(f"Invalid User Pool ID format: {user_pool_id}")
 
 
-def _get_cognito_token(
+def _create_client() -> httpx.AsyncClient:
+    """
+    Create an async HTTP client for concurrent token requests.
+
+    Connection failures are retried by the transport; with h2 installed,
+    requests to the same OAuth domain are multiplexed over one connection.
+    Waiting for a free pooled connection is not subject to a timeout, so
+    large batches queue instead of failing.
+
+    Returns:
+        httpx.AsyncClient sharing connections to the OAuth domain
+    """
+    transport = httpx.AsyncHTTPTransport(
+        http2=_HTTP2_AVAILABLE,
+        limits=httpx.Limits(max_connections=MAX_TOKEN_CONNECTIONS),
+        retries=_MAX_RETRIES,
+    )
+    return httpx.AsyncClient(
+        transport=transport,
+        timeout=httpx.Timeout(30.0, pool=None),
+    )
+
+
+def _build_token_request(
     cognito_domain_url: str,
-    client_id: str,
-    client_secret: str,
-    audience: str = "MCPGateway",
-) -> Dict[str, Any]:
+    audience: str = "MCPGateway"
+) -> Tuple[str, Dict[str, str], Dict[str, str], bool]:
     """
-    Get OAuth2 token from Amazon Cognito or Auth0 using client credentials grant type.
+    Build the provider-specific parts of a client credentials token request.
+
+    Called once per run; only the client credentials vary between gateways.
 
     Args:
         cognito_domain_url: The full Cognito/Auth0 domain URL
-        client_id: The App Client ID
-        client_secret: The App Client Secret
         audience: The audience for the token (default: MCPGateway)
 
     Returns:
-        Token response containing access_token, expires_in, token_type
+        Tuple of (url, headers, data_template, is_json) where is_json is True
+        for Auth0 (JSON body) and False for Cognito (form body)
     """
     # Construct the token endpoint URL
     if "auth0.com" in cognito_domain_url:
         url = f"{cognito_domain_url.rstrip('/')}/oauth/token"
         # Use JSON format for Auth0
         headers = {"Content-Type": "application/json"}
-        data = {
-            "client_id": client_id,
-            "client_secret": client_secret,
+        data_template = {
             "audience": audience,
             "grant_type": "client_credentials",
             "scope": "invoke:gateway",
         }
-        # Send as JSON for Auth0
-        response_method = lambda: requests.post(url, headers=headers, json=data)
-    else:
-        # Cognito format
-        url = f"{cognito_domain_url.rstrip('/')}/oauth2/token"
-        headers = {"Content-Type": "application/x-www-form-urlencoded"}
-        data = {
-            "grant_type": "client_credentials",
-            "client_id": client_id,
-            "client_secret": client_secret,
-        }
-        # Send as form data for Cognito
-        response_method = lambda: requests.post(url, headers=headers, data=data)
+        return url, headers, data_template, True
+
+    # Cognito format
+    url = f"{cognito_domain_url.rstrip('/')}/oauth2/token"
+    headers = {"Content-Type": "application/x-www-form-urlencoded"}
+    data_template = {"grant_type": "client_credentials"}
+    return url, headers, data_template, False
+
+
+async def _exec_token_request(
+    client: httpx.AsyncClient,
+    url: str,
+    headers: Dict[str, str],
+    data_template: Dict[str, str],
+    client_id: str,
+    client_secret: str,
+    is_json: bool
+) -> Dict[str, Any]:
+    """
+    Get OAuth2 token from Amazon Cognito or Auth0 using client credentials grant type.
+
+    Responses with a 429 or 5xx status are retried up to _MAX_RETRIES times;
+    a client-credentials grant has no side effects, so repeating it is safe.
+
+    Args:
+        client: HTTP client to send the request on
+        url: Token endpoint from _build_token_request
+        headers: Request headers from _build_token_request
+        data_template: Request body fields shared by all gateways
+        client_id: The App Client ID
+        client_secret: The App Client Secret
+        is_json: Send the body as JSON (Auth0) instead of form data (Cognito)
+
+    Returns:
+        Token response containing access_token, expires_in, token_type
+    """
+    data = {**data_template, "client_id": client_id, "client_secret": client_secret}
+    body = {"json": data} if is_json else {"data": data}
 
     try:
-        # Make the request
-        response = response_method()
+        # Make the request, backing off on transient failures
+        for attempt in range(_MAX_RETRIES + 1):
+            response = await client.post(url, headers=headers, **body)
+            if response.status_code not in _RETRY_STATUS_CODES or attempt == _MAX_RETRIES:
+                break
+            await asyncio.sleep(_RETRY_BACKOFF_FACTOR * (2 ** attempt))
         response.raise_for_status()  # Raise exception for bad status codes
 
-        provider_type = "Auth0" if "auth0.com" in cognito_domain_url else "Cognito"
-        logger.info(f"Successfully obtained {provider_type} access token")
-        return response.json()
+        # Some misconfigured providers report errors with a 200 status
+        token_response = response.json()
+        if "error" in token_response:
+            raise ValueError(
+                f"Token endpoint returned error '{token_response['error']}': "
+                f"{token_response.get('error_description', 'no description')}"
+            )
+        if not token_response.get("access_token"):
+            raise ValueError("Token endpoint response does not contain an access_token")
+
+        logger.info("Successfully obtained %s access token", "Auth0" if is_json else "Cognito")
+        return token_response
 
-    except requests.exceptions.RequestException as e:
-        logger.error(f"Error getting token: {e}")
-        if hasattr(response, "text") and response.text:
-            logger.error(f"Response: {response.text}")
+    except httpx.HTTPError as e:
+        logger.error("Error getting token: %s", e)
+        if isinstance(e, httpx.HTTPStatusError) and e.response.text:
+            logger.error("Response: %s", e.response.text)
         raise
 
 
+class _SingleFlightTokenCache:
+    """
+    Client-credentials token responses keyed on the client credentials.
+
+    The token endpoint and request template are fixed for the cache, so
+    gateways that share (client_id, client_secret) get one token request
+    between them; concurrent callers for the same key await the same task
+    instead of issuing duplicate requests. A failed request is remembered
+    too, so every config sharing bad credentials fails without retrying it.
+    """
+
+    def __init__(
+        self,
+        client: httpx.AsyncClient,
+        cognito_domain_url: str,
+        audience: str
+    ):
+        self._client = client
+        self.cognito_domain_url = cognito_domain_url
+        self.audience = audience
+        self._url, self._headers, self._data_template, self._is_json = _build_token_request(
+            cognito_domain_url, audience
+        )
+        self._tasks: Dict[Tuple[str, str], "asyncio.Task[Dict[str, Any]]"] = {}
+
+    async def get_token(
+        self,
+        client_id: str,
+        client_secret: str
+    ) -> Dict[str, Any]:
+        """Return the token response for these credentials, fetching it at most once."""
+        key = (client_id, client_secret)
+        task = self._tasks.get(key)
+        if task is None:
+            task = asyncio.create_task(_exec_token_request(
+                client=self._client,
+                url=self._url,
+                headers=self._headers,
+                data_template=self._data_template,
+                client_id=client_id,
+                client_secret=client_secret,
+                is_json=self._is_json,
+            ))
+            self._tasks[key] = task
+        else:
+            logger.info("Reusing token obtained for identical client credentials")
+        return await task
+
+
+def _format_utc_timestamp(
+    timestamp: float
+) -> str:
+    """
+    Format a Unix timestamp as 'YYYY-MM-DD HH:MM:SS UTC'.
+
+    Args:
+        timestamp: Seconds since the epoch
+
+    Returns:
+        Human-readable UTC timestamp
+    """
+    return datetime.fromtimestamp(timestamp, tz=_UTC).strftime('%Y-%m-%d %H:%M:%S UTC')
+
+
+def _egress_token_filename(
+    provider: str,
+    server_name: Optional[str] = None
+) -> str:
+    """
+    Build the egress token filename for a provider and optional server name.
+
+    Args:
+        provider: Auth provider name
+        server_name: Server name from config
+
+    Returns:
+        {provider}-{server_name}-egress.json or {provider}-egress.json
+    """
+    if server_name:
+        return f"{provider}-{server_name.lower()}-egress.json"
+    return f"{provider}-egress.json"
+
+
+def _is_cached_token_valid(
+    egress_path: Path,
+    refresh_skew: int,
+    client_id: str,
+    audience: str,
+    cognito_domain_url: str
+) -> bool:
+    """
+    Check whether a previously saved egress token can be reused.
+
+    Args:
+        egress_path: Path to the egress token file
+        refresh_skew: Seconds of remaining validity required for reuse
+        client_id: OAuth client ID the token must have been issued to
+        audience: Token audience the token must have been requested for
+        cognito_domain_url: Cognito domain the token must have come from
+
+    Returns:
+        True if the file holds an access token issued for the same client,
+        audience and Cognito domain that expires more than refresh_skew
+        seconds from now
+    """
+    try:
+        with open(egress_path, 'r') as f:
+            cached = json.load(f)
+        expires_at = float(cached["expires_at"])
+        if not cached.get("access_token"):
+            return False
+        if (cached.get("client_id"), cached.get("audience"), cached.get("cognito_domain")) != \
+                (client_id, audience, cognito_domain_url):
+            logger.debug("Cached token %s was issued for different settings", egress_path)
+            return False
+    except FileNotFoundError:
+        return False
+    except (OSError, ValueError, KeyError, TypeError) as e:
+        logger.debug("Ignoring unreadable cached token %s: %s", egress_path, e)
+        return False
+
+    return expires_at - time.time() > refresh_skew
+
+
 def _save_egress_token(
     token_response: Dict[str, Any],
+    tokens_dir: Path,
     provider: str = "bedrock-agentcore",
     server_name: Optional[str] = None,
-    oauth_tokens_dir: str = ".oauth-tokens"
+    saved_at_ts: Optional[float] = None,
+    saved_at_human: Optional[str] = None,
+    client_id: Optional[str] = None,
+    audience: Optional[str] = None,
+    cognito_domain_url: Optional[str] = None
 ) -> str:
     """
     Save the access token as an egress token file following the same structure as Atlassian tokens.
 
     Args:
         token_response: Token response from OAuth provider
+        tokens_dir: Existing .oauth-tokens directory (created by the caller)
         provider: Auth provider name (default: bedrock-agentcore)
         server_name: Server name from config (for filename)
-        oauth_tokens_dir: Path to .oauth-tokens directory
+        saved_at_ts: Batch timestamp to record; defaults to now
+        saved_at_human: saved_at_ts formatted by _format_utc_timestamp
+        client_id: OAuth client ID the token was issued to
+        audience: Token audience the token was requested for
+        cognito_domain_url: Cognito domain the token came from
         
     Returns:
         Path to the saved token file
+
+    Raises:
+        ValueError: If token_response has no access_token
     """
-    # Create oauth-tokens directory if it doesn't exist
-    tokens_dir = Path(oauth_tokens_dir)
-    tokens_dir.mkdir(exist_ok=True, mode=0o700)
-    
+    if not token_response.get("access_token"):
+        raise ValueError("Token response does not contain an access_token; not saving")
+
     # Calculate expiration timestamp and human-readable format
     expires_in = token_response.get('expires_in', 10800)  # Default 3 hours
-    current_time = time.time()
-    expires_at = current_time + expires_in
-    expires_at_human = datetime.fromtimestamp(expires_at, tz=timezone.utc).strftime('%Y-%m-%d %H:%M:%S UTC')
-    saved_at = datetime.fromtimestamp(current_time, tz=timezone.utc).strftime('%Y-%m-%d %H:%M:%S UTC')
+    if saved_at_ts is None:
+        saved_at_ts = time.time()
+        saved_at_human = None
+    if saved_at_human is None:
+        saved_at_human = _format_utc_timestamp(saved_at_ts)
+    expires_at = saved_at_ts + expires_in
+    expires_at_human = _format_utc_timestamp(expires_at)
     
     # Build egress token data structure
     egress_data = {
@@ -190,7 +447,10 @@ def _save_egress_token(
         "expires_at_human": expires_at_human,
         "token_type": token_response.get("token_type", "Bearer"),
         "scope": token_response.get("scope", "invoke:gateway"),
-        "saved_at": saved_at,
+        "saved_at": saved_at_human,
+        "client_id": client_id,
+        "audience": audience,
+        "cognito_domain": cognito_domain_url,
         "usage_notes": f"This token is for EGRESS authentication to {provider} external services"
     }
     
@@ -198,23 +458,25 @@ def _save_egress_token(
     if "refresh_token" in token_response:
         egress_data["refresh_token"] = token_response["refresh_token"]
     
-    # Determine filename: {provider}-{server_name}-egress.json or {provider}-egress.json
-    if server_name:
-        filename = f"{provider}-{server_name.lower()}-egress.json"
-    else:
-        filename = f"{provider}-egress.json"
-    
-    # Save to file
-    egress_path = tokens_dir / filename
-    with open(egress_path, 'w') as f:
-        json.dump(egress_data, f, indent=2)
-    
-    # Set secure file permissions
-    egress_path.chmod(0o600)
+    # Serialize before touching the filesystem, then write a 0600 temp file
+    # and rename it over the target so readers never see a partial or
+    # world-readable token. Saves run on the event loop thread one at a time,
+    # so a per-process temp name is enough.
+    payload = json.dumps(egress_data, indent=2).encode()
+    egress_path = tokens_dir / _egress_token_filename(provider, server_name)
+    tmp_path = egress_path.with_name(f".{egress_path.name}.{os.getpid()}.tmp")
+    fd = os.open(tmp_path, os.O_WRONLY | os.O_CREAT | os.O_EXCL, 0o600)
+    try:
+        with os.fdopen(fd, 'wb') as f:
+            f.write(payload)
+        os.replace(tmp_path, egress_path)
+    except BaseException:
+        tmp_path.unlink(missing_ok=True)
+        raise
     
-    logger.info(f"Egress token saved to {egress_path}")
-    logger.info(f"Token expires at: {expires_at_human}")
-    logger.info(f"Token expires in {expires_in} seconds")
+    logger.info("Egress token saved to %s", egress_path)
+    logger.info("Token expires at: %s", expires_at_human)
+    logger.info("Token expires in %s seconds", expires_in)
     
     return str(egress_path)
 
@@ -233,30 +495,104 @@ def _get_cognito_domain_from_env() -> Tuple[str, Optional[str]]:
     if not cognito_domain and user_pool_id:
         cognito_region = _extract_cognito_region_from_pool_id(user_pool_id)
         cognito_domain = f"https://cognito-idp.{cognito_region}.amazonaws.com/{user_pool_id}"
-        logger.info(f"Constructed Cognito domain from pool ID: {cognito_domain}")
+        logger.info("Constructed Cognito domain from pool ID: %s", cognito_domain)
 
     return cognito_domain, user_pool_id
 
 
+async def _generate_token_for_config(
+    token_cache: _SingleFlightTokenCache,
+    config: Dict[str, Any],
+    oauth_tokens_path: Path,
+    refresh_skew: int = DEFAULT_REFRESH_SKEW_SECONDS,
+    force: bool = False,
+    saved_at_ts: Optional[float] = None,
+    saved_at_human: Optional[str] = None
+) -> str:
+    """
+    Fetch and save the egress token for one gateway configuration.
+
+    Args:
+        token_cache: Shared single-flight cache of token responses
+        config: Gateway configuration from _load_gateway_configs
+        oauth_tokens_path: Resolved, existing .oauth-tokens directory
+        refresh_skew: Reuse a saved token with more than this many seconds left
+        force: Always request a new token, ignoring any saved token
+        saved_at_ts: Batch timestamp recorded in the saved token
+        saved_at_human: saved_at_ts formatted by _format_utc_timestamp
+
+    Returns:
+        Path to the saved (or reused) token file
+    """
+    client_id = config['client_id']
+    client_secret = config['client_secret']
+    gateway_arn = config.get('gateway_arn')
+    server_name = config.get('server_name')
+
+    logger.info("\nProcessing gateway configuration #%d: %s", config['index'], server_name or 'unnamed')
+
+    if gateway_arn:
+        logger.info("Gateway ARN: %s", gateway_arn)
+
+    if not force:
+        egress_path = oauth_tokens_path / _egress_token_filename("bedrock-agentcore", server_name)
+        if _is_cached_token_valid(
+            egress_path, refresh_skew,
+            client_id=client_id,
+            audience=token_cache.audience,
+            cognito_domain_url=token_cache.cognito_domain_url
+        ):
+            logger.info("Reusing cached token from %s", egress_path)
+            return str(egress_path)
+
+    logger.info("Generating OAuth2 access token...")
+
+    # Generate token
+    token_response = await token_cache.get_token(
+        client_id=client_id,
+        client_secret=client_secret,
+    )
+
+    # Save token as egress token file
+    saved_path = _save_egress_token(
+        token_response=token_response,
+        tokens_dir=oauth_tokens_path,
+        provider="bedrock-agentcore",
+        server_name=server_name,
+        saved_at_ts=saved_at_ts,
+        saved_at_human=saved_at_human,
+        client_id=client_id,
+        audience=token_cache.audience,
+        cognito_domain_url=token_cache.cognito_domain_url
+    )
+
+    logger.info("Token generation completed successfully! Egress token saved to %s", saved_path)
+    return saved_path
+
+
 def generate_access_token(
     gateway_index: Optional[int] = None,
     gateway_name: Optional[str] = None,
     oauth_tokens_dir: str = ".oauth-tokens",
     audience: str = "MCPGateway",
-    generate_all: bool = False
+    generate_all: bool = False,
+    refresh_skew: int = DEFAULT_REFRESH_SKEW_SECONDS,
+    force: bool = False
 ) -> None:
     """
     Generate access token for AgentCore Gateway using environment variables.
 
     Args:
-        gateway_index: Index of gateway configuration to use (1-100)
+        gateway_index: Index of gateway configuration to use
         gateway_name: Name of gateway to generate token for
         oauth_tokens_dir: Path to .oauth-tokens directory
         audience: Token audience for OAuth providers
         generate_all: Generate tokens for all configured gateways
+        refresh_skew: Reuse saved tokens with more than this many seconds left
+        force: Request new tokens even if saved tokens are still valid
     """
-    # Load environment variables
-    load_dotenv()
+    # Load environment variables (no-op after the first call)
+    _load_env()
 
     # Get singleton Cognito configuration
     cognito_domain, user_pool_id = _get_cognito_domain_from_env()
@@ -275,7 +611,7 @@ def generate_access_token(
 
     if generate_all:
         configs_to_process = gateway_configs
-        logger.info(f"Generating tokens for all {len(gateway_configs)} configured gateways")
+        logger.info("Generating tokens for all %d configured gateways", len(gateway_configs))
     elif gateway_index:
         config = next((c for c in gateway_configs if c['index'] == gateway_index), None)
         if not config:
@@ -290,7 +626,7 @@ def generate_access_token(
     else:
         # Default to first configuration
         configs_to_process = [gateway_configs[0]]
-        logger.info(f"Using first gateway configuration: {gateway_configs[0].get('server_name', 'config_1')}")
+        logger.info("Using first gateway configuration: %s", gateway_configs[0].get('server_name', 'config_1'))
 
     # Resolve oauth_tokens_dir path relative to current working directory
     if not Path(oauth_tokens_dir).is_absolute():
@@ -298,43 +634,45 @@ def generate_access_token(
     else:
         oauth_tokens_path = Path(oauth_tokens_dir)
 
-    # Process each configuration
-    for config in configs_to_process:
-        client_id = config['client_id']
-        client_secret = config['client_secret']
-        gateway_arn = config.get('gateway_arn')
-        server_name = config.get('server_name')
+    # Create oauth-tokens directory once for the whole batch
+    oauth_tokens_path.mkdir(exist_ok=True, mode=0o700)
 
-        logger.info(f"\nProcessing gateway configuration #{config['index']}: {server_name or 'unnamed'}")
-
-        if gateway_arn:
-            logger.info(f"Gateway ARN: {gateway_arn}")
-
-        logger.info("Generating OAuth2 access token...")
+    # One timestamp for the whole batch; expiry is measured from here, which
+    # errs on the side of refreshing slightly early
+    saved_at_ts = time.time()
+    saved_at_human = _format_utc_timestamp(saved_at_ts)
 
+    async def _process_config(
+        token_cache: _SingleFlightTokenCache,
+        config: Dict[str, Any]
+    ) -> Optional[Exception]:
         try:
-            # Generate token
-            token_response = _get_cognito_token(
-                cognito_domain_url=cognito_domain,
-                client_id=client_id,
-                client_secret=client_secret,
-                audience=audience,
+            await _generate_token_for_config(
+                token_cache, config, oauth_tokens_path,
+                refresh_skew=refresh_skew, force=force,
+                saved_at_ts=saved_at_ts, saved_at_human=saved_at_human
             )
-
-            # Save token as egress token file
-            saved_path = _save_egress_token(
-                token_response=token_response,
-                provider="bedrock-agentcore",
-                server_name=server_name,
-                oauth_tokens_dir=str(oauth_tokens_path)
+            return None
+        except Exception as e:
+            config_name = config.get('server_name') or f"config_{config['index']}"
+            logger.error("Failed to generate token for %s: %s", config_name, e)
+            return e
+
+    async def _process_all() -> List[Optional[Exception]]:
+        # Token requests are network-bound; issue them all from one event loop
+        # over a shared connection pool to the OAuth domain
+        async with _create_client() as client:
+            token_cache = _SingleFlightTokenCache(client, cognito_domain, audience)
+            return await asyncio.gather(
+                *(_process_config(token_cache, config) for config in configs_to_process)
             )
 
-            logger.info(f"Token generation completed successfully! Egress token saved to {saved_path}")
+    errors = [e for e in asyncio.run(_process_all()) if e]
 
-        except Exception as e:
-            logger.error(f"Failed to generate token for {server_name or f'config_{config['index']}'}: {e}")
-            if not generate_all:
-                raise
+    if errors:
+        if not generate_all:
+            raise errors[0]
+        logger.error("Token generation failed for %d of %d gateways", len(errors), len(configs_to_process))
 
 
 def _parse_arguments() -> argparse.Namespace:
@@ -367,6 +705,9 @@ Examples:
     # Custom audience for Auth0
     python generate_access_token.py --audience "https://api.mycompany.com"
 
+    # Request new tokens even if the saved ones are still valid
+    python generate_access_token.py --all --force
+
 Environment Variables:
     # Singleton configuration (shared across all gateways):
     COGNITO_DOMAIN          - Cognito/OAuth domain URL
@@ -383,7 +724,7 @@ Environment Variables:
     parser.add_argument(
         "--gateway-index",
         type=int,
-        help="Index of gateway configuration to use (1-100)",
+        help="Index of gateway configuration to use",
     )
 
     parser.add_argument(
@@ -409,6 +750,19 @@ Environment Variables:
         help="Token audience (default: MCPGateway)",
     )
 
+    parser.add_argument(
+        "--refresh-skew",
+        type=int,
+        default=DEFAULT_REFRESH_SKEW_SECONDS,
+        help=f"Reuse saved tokens valid for more than this many seconds (default: {DEFAULT_REFRESH_SKEW_SECONDS})",
+    )
+
+    parser.add_argument(
+        "--force",
+        action="store_true",
+        help="Request new tokens even if saved tokens are still valid",
+    )
+
     parser.add_argument(
         "--debug",
         action="store_true",
@@ -424,6 +778,7 @@ def main() -> None:
 
     if args.debug:
         logging.getLogger().setLevel(logging.DEBUG)
+        logging.getLogger("httpx").setLevel(logging.DEBUG)
 
     try:
         generate_access_token(
@@ -432,9 +787,11 @@ def main() -> None:
             oauth_tokens_dir=args.oauth_tokens_dir,
             audience=args.audience,
             generate_all=args.all,
+            refresh_skew=args.refresh_skew,
+            force=args.force,
         )
     except Exception as e:
-        logger.error(f"Token generation failed: {e}")
+        logger.error("Token generation failed: %s", e)
         exit(1)
 
 
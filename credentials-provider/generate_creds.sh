@@ -295,6 +295,10 @@ run_keycloak_auth() {
 
     local cmd="uv run '$SCRIPT_DIR/keycloak/generate_tokens.py' --all-agents"
 
+    if [ "$FORCE" = true ]; then
+        cmd="$cmd --force"
+    fi
+
     if [ "$VERBOSE" = true ]; then
         cmd="$cmd --verbose"
     fi
@@ -7,12 +7,16 @@ Python version of generate-agent-token.sh with batch processing capabilities
 import os
 import sys
 import json
-import requests
+import asyncio
+import httpx
 import argparse
 import logging
-from typing import Dict, Any, Optional, List
-from datetime import datetime, timezone
-import glob
+import threading
+from contextvars import ContextVar
+from dataclasses import dataclass, field
+from typing import Dict, Any, Optional, Iterable, Iterator, List, Tuple
+from datetime import datetime, timedelta, timezone
+from email.utils import parsedate_to_datetime
 from pathlib import Path
 
 
@@ -25,138 +29,410 @@ class Colors:
     NC = '\033[0m'  # No Color
 
 
+# Seconds to wait for a connection to Keycloak, and for it to answer a token request
+CONNECT_TIMEOUT = 3
+REQUEST_TIMEOUT = 10
+
+# Transient Keycloak failures are retried with exponential backoff
+MAX_RETRIES = 3
+RETRY_BACKOFF_FACTOR = 0.3
+RETRY_STATUS_CODES = frozenset({500, 502, 503, 504})
+
+# Maximum number of agents whose tokens are requested concurrently
+MAX_CONCURRENT_AGENTS = 8
+
+# Saved tokens are reused only while they stay valid at least this long
+TOKEN_REFRESH_SKEW_SECONDS = 300
+
+try:
+    import h2  # noqa: F401
+    _HTTP2_AVAILABLE = True
+except ImportError:
+    _HTTP2_AVAILABLE = False
+
+# Log level for positive outcomes, shown in green between INFO and WARNING
+SUCCESS = 25
+logging.addLevelName(SUCCESS, 'SUCCESS')
+
+# In batch mode each agent's output is collected here and printed as one block
+_output_buffer: ContextVar[Optional[List[Tuple[str, Any]]]] = ContextVar('_output_buffer', default=None)
+
+
+# Resolved once so symlinked invocations still find the repository layout
+_CREDENTIALS_PROVIDER_DIR = Path(__file__).resolve().parent.parent
+_DEFAULT_OAUTH_DIR = _CREDENTIALS_PROVIDER_DIR.parent / ".oauth-tokens"
+
+try:
+    from ..utils import redact_sensitive_value
+except ImportError:
+    # Fallback for when running as standalone script
+    if (_CREDENTIALS_PROVIDER_DIR / "utils.py").exists():
+        sys.path.insert(0, str(_CREDENTIALS_PROVIDER_DIR))
+        from utils import redact_sensitive_value
+    else:
+        # Simple fallback redaction function
+        def redact_sensitive_value(value: str, show_chars: int = 8) -> str:
+            if not value or len(value) <= show_chars:
+                return "*" * len(value) if value else ""
+            return value[:show_chars] + "*" * (len(value) - show_chars)
+
+# Form fields shared by every client credentials token request
+_TOKEN_REQUEST_FIELDS = {
+    'grant_type': 'client_credentials',
+    'scope': 'openid email profile'
+}
+
+
+def _token_url(keycloak_url: str, realm: str) -> str:
+    """Build the OpenID Connect token endpoint URL for a Keycloak realm"""
+    return f"{keycloak_url}/realms/{realm}/protocol/openid-connect/token"
+
+
+def _retry_delay(response: httpx.Response, attempt: int) -> float:
+    """Seconds to wait before retrying a token request
+
+    A Retry-After header (seconds or an HTTP date) takes precedence over the
+    exponential backoff, as urllib3's Retry does.
+    """
+    retry_after = response.headers.get('Retry-After')
+    if retry_after:
+        try:
+            return max(0.0, float(retry_after))
+        except ValueError:
+            pass
+        try:
+            retry_at = parsedate_to_datetime(retry_after)
+            return max(0.0, (retry_at - datetime.now(timezone.utc)).total_seconds())
+        except (TypeError, ValueError):
+            pass
+    return RETRY_BACKOFF_FACTOR * (2 ** attempt)
+
+
+def _create_client() -> httpx.AsyncClient:
+    """Create a pooled HTTP client so token requests reuse Keycloak connections
+
+    Connection errors are retried by the transport; 5xx responses are retried
+    by TokenGenerator._get_token_async. A client credentials grant has no side
+    effects, so repeating the POST is safe.
+    """
+    transport = httpx.AsyncHTTPTransport(
+        http2=_HTTP2_AVAILABLE,
+        limits=httpx.Limits(max_connections=16, max_keepalive_connections=16),
+        retries=MAX_RETRIES
+    )
+    timeout = httpx.Timeout(REQUEST_TIMEOUT, connect=CONNECT_TIMEOUT)
+    return httpx.AsyncClient(transport=transport, timeout=timeout)
+
+
+def _write_file_atomic(path: str, content: str):
+    """Write content to path in one call via a 0600 temp file and rename
+
+    Readers see either the old file or the complete new one, and the token
+    is never readable by other users, even briefly.
+    """
+    tmp_path = f"{path}.{os.getpid()}.{threading.get_ident()}.tmp"
+    fd = os.open(tmp_path, os.O_WRONLY | os.O_CREAT | os.O_EXCL, 0o600)
+    try:
+        with os.fdopen(fd, 'w') as f:
+            f.write(content)
+        os.replace(tmp_path, path)
+    except BaseException:
+        if os.path.exists(tmp_path):
+            os.remove(tmp_path)
+        raise
+
+
+def _emit(message: str, file=None):
+    """Print message, or hold it for the current agent's block in batch mode"""
+    buffer = _output_buffer.get()
+    if buffer is not None:
+        buffer.append((message, file))
+    else:
+        print(message, file=file)
+
+
+def _flush_output(buffer: List[Tuple[str, Any]]):
+    """Print the messages held for one agent's block"""
+    for message, file in buffer:
+        print(message, file=file)
+
+
+class _ColorFormatter(logging.Formatter):
+    """Format records as the colored [LEVEL] lines the script has always printed"""
+
+    # Debug records are the verbose-only detail lines, shown as [INFO]
+    _LABELS = {
+        logging.DEBUG: f"{Colors.BLUE}[INFO]{Colors.NC}",
+        logging.INFO: f"{Colors.BLUE}[INFO]{Colors.NC}",
+        SUCCESS: f"{Colors.GREEN}[SUCCESS]{Colors.NC}",
+        logging.WARNING: f"{Colors.YELLOW}[WARNING]{Colors.NC}",
+        logging.ERROR: f"{Colors.RED}[ERROR]{Colors.NC}",
+    }
+
+    def format(self, record: logging.LogRecord) -> str:
+        label = self._LABELS.get(record.levelno, f"[{record.levelname}]")
+        return f"{label} {record.getMessage()}"
+
+
+class _ConsoleHandler(logging.Handler):
+    """Send errors to stderr and everything else to stdout, via the batch buffer"""
+
+    def emit(self, record: logging.LogRecord):
+        try:
+            file = sys.stderr if record.levelno >= logging.ERROR else None
+            _emit(self.format(record), file)
+        except Exception:
+            self.handleError(record)
+
+
+@dataclass(slots=True)
+class AgentJob:
+    """Validated settings for one agent's token request"""
+    name: str
+    client_id: str
+    client_secret: str
+    keycloak_url: str
+    realm: str
+    token_url: str = field(init=False)
+
+    def __post_init__(self):
+        # Fixed for the job, so build it once rather than per request
+        self.token_url = _token_url(self.keycloak_url, self.realm)
+
+
 class TokenGenerator:
     """Generate tokens for MCP agents using Keycloak OAuth2"""
 
-    def __init__(self, verbose: bool = False):
+    def __init__(self, verbose: bool = False, force_refresh: bool = False, emit_env: bool = True):
         self.verbose = verbose
+        self.force_refresh = force_refresh
+        self.emit_env = emit_env
         self.setup_logging()
+        # Batch-mode token requests in flight, keyed on (token_url, client_id, client_secret)
+        self._inflight: Dict[Tuple[str, str, str], asyncio.Task] = {}
+        # Parsed agent configs, keyed on config file path
+        self._config_cache: Dict[str, Dict[str, Any]] = {}
 
     def setup_logging(self):
-        """Setup logging configuration"""
-        level = logging.DEBUG if self.verbose else logging.INFO
-        logging.basicConfig(
-            level=level,
-            format='%(asctime)s - %(levelname)s - %(message)s'
-        )
-        self.logger = logging.getLogger(__name__)
-
-    def log(self, message: str):
-        """Log info message if verbose mode is enabled"""
-        if self.verbose:
-            print(f"{Colors.BLUE}[INFO]{Colors.NC} {message}")
-
-    def error(self, message: str):
-        """Print error message"""
-        print(f"{Colors.RED}[ERROR]{Colors.NC} {message}", file=sys.stderr)
-
-    def success(self, message: str):
-        """Print success message"""
-        print(f"{Colors.GREEN}[SUCCESS]{Colors.NC} {message}")
-
-    def warning(self, message: str):
-        """Print warning message"""
-        print(f"{Colors.YELLOW}[WARNING]{Colors.NC} {message}")
+        """Setup logging configuration
 
-    def load_agent_config(self, agent_name: str, oauth_tokens_dir: str) -> Optional[Dict[str, Any]]:
-        """Load agent configuration from JSON file"""
-        config_file = os.path.join(oauth_tokens_dir, f"{agent_name}.json")
+        The console handler is attached once per process, so creating several
+        generators does not duplicate output.
+        """
+        self.logger = logging.getLogger(__name__)
+        self.logger.setLevel(logging.DEBUG if self.verbose else logging.INFO)
+        self.logger.propagate = False
+        if not any(isinstance(h, _ConsoleHandler) for h in self.logger.handlers):
+            handler = _ConsoleHandler()
+            handler.setFormatter(_ColorFormatter())
+            self.logger.addHandler(handler)
+
+    def _print(self, message: str = "", file=None):
+        """Print message, or hold it for the current agent's block in batch mode"""
+        _emit(message, file)
+
+    def load_agent_config(self, agent_name: str, oauth_tokens_dir: str,
+                          config_path: Optional[Path] = None) -> Optional[Dict[str, Any]]:
+        """Load agent configuration from JSON file
+
+        config_path, when known (e.g. from the directory scan), is used as is.
+        Each file is read and parsed at most once per generator.
+        """
+        config_file = str(config_path) if config_path else os.path.join(oauth_tokens_dir, f"{agent_name}.json")
 
-        if not os.path.exists(config_file):
-            self.error(f"Config file not found: {config_file}")
-            return None
+        config = self._config_cache.get(config_file)
+        if config is not None:
+            return config
 
-        self.log(f"Loading config from: {config_file}")
+        self.logger.debug("Loading config from: %s", config_file)
 
         try:
             with open(config_file, 'r') as f:
                 config = json.load(f)
+            self._config_cache[config_file] = config
             return config
+        except FileNotFoundError:
+            self.logger.error("Config file not found: %s", config_file)
+            return None
         except json.JSONDecodeError as e:
-            self.error(f"Failed to parse JSON config file: {e}")
+            self.logger.error("Failed to parse JSON config file: %s", e)
             return None
         except Exception as e:
-            self.error(f"Failed to load config file: {e}")
+            self.logger.error("Failed to load config file: %s", e)
+            return None
+
+    def _log_token_request(self, token_url: str, client_id: str, realm: str):
+        """Log the target of a token request in verbose mode"""
+        self.logger.debug("Token URL: %s", token_url)
+        self.logger.debug("Client ID: %s", client_id)
+        self.logger.debug("Realm: %s", realm)
+
+    def _parse_token_response(self, status_code: int, content: bytes) -> Optional[Dict[str, Any]]:
+        """Parse a token endpoint response, reporting Keycloak's own error details on failure"""
+        try:
+            token_data = json.loads(content)
+        except json.JSONDecodeError as e:
+            if status_code >= 400:
+                self.logger.error("Token request failed with HTTP %s: %s", status_code,
+                                  content.decode('utf-8', errors='replace'))
+            else:
+                self.logger.error("Invalid JSON response: %s", e)
+            return None
+
+        if status_code >= 400:
+            detail = token_data
+            if isinstance(token_data, dict):
+                detail = token_data.get('error_description') or token_data.get('error') or token_data
+            self.logger.error("Token request failed with HTTP %s: %s", status_code, detail)
+            return None
+
+        return self._validate_token_response(token_data)
+
+    def _validate_token_response(self, token_data: Dict[str, Any]) -> Optional[Dict[str, Any]]:
+        """Return token_data if it holds an access token, reporting errors otherwise"""
+        # Check for error in response
+        if 'error_description' in token_data:
+            self.logger.error("Token request failed: %s", token_data['error_description'])
+            return None
+
+        # Validate access token exists
+        if 'access_token' not in token_data:
+            self.logger.error("No access token in response")
+            self.logger.debug("Response: %s", token_data)
             return None
 
+        return token_data
+
     def get_token_from_keycloak(self, client_id: str, client_secret: str,
                                keycloak_url: str, realm: str) -> Optional[Dict[str, Any]]:
-        """Request access token from Keycloak"""
-        token_url = f"{keycloak_url}/realms/{realm}/protocol/openid-connect/token"
-
-        self.log(f"Token URL: {token_url}")
-        self.log(f"Client ID: {client_id}")
-        self.log(f"Realm: {realm}")
-
-        data = {
-            'grant_type': 'client_credentials',
-            'client_id': client_id,
-            'client_secret': client_secret,
-            'scope': 'openid email profile'
-        }
+        """Request access token from Keycloak
 
-        headers = {
-            'Content-Type': 'application/x-www-form-urlencoded'
-        }
+        Runs the same request coroutine as batch mode, so both modes share one
+        HTTP client implementation and retry policy.
+        """
+        return self._request_token(_token_url(keycloak_url, realm), client_id, client_secret, realm)
 
-        try:
-            response = requests.post(token_url, data=data, headers=headers)
-            response.raise_for_status()
+    def _request_token(self, token_url: str, client_id: str, client_secret: str,
+                       realm: str) -> Optional[Dict[str, Any]]:
+        """Request an access token from a known token endpoint"""
+        self._log_token_request(token_url, client_id, realm)
+        return asyncio.run(self._get_token_once(token_url, client_id, client_secret))
 
-            token_data = response.json()
+    async def _get_token_once(self, token_url: str, client_id: str,
+                              client_secret: str) -> Optional[Dict[str, Any]]:
+        """Request one access token on a client of its own"""
+        async with _create_client() as client:
+            return await self._get_token_async(client, token_url, client_id, client_secret)
 
-            # Check for error in response
-            if 'error_description' in token_data:
-                self.error(f"Token request failed: {token_data['error_description']}")
-                return None
+    async def _get_token_async(self, client: httpx.AsyncClient, token_url: str, client_id: str,
+                               client_secret: str) -> Optional[Dict[str, Any]]:
+        """Request access token from Keycloak without blocking the event loop"""
+        data = {**_TOKEN_REQUEST_FIELDS, 'client_id': client_id, 'client_secret': client_secret}
 
-            # Validate access token exists
-            if 'access_token' not in token_data:
-                self.error("No access token in response")
-                self.log(f"Response: {token_data}")
-                return None
+        try:
+            # Connection errors are retried by the transport; retry 5xx here
+            for attempt in range(MAX_RETRIES + 1):
+                response = await client.post(token_url, data=data)
+                if response.status_code not in RETRY_STATUS_CODES or attempt == MAX_RETRIES:
+                    break
+                self.logger.debug("Keycloak returned HTTP %s, retrying", response.status_code)
+                await asyncio.sleep(_retry_delay(response, attempt))
+        except httpx.HTTPError as e:
+            self.logger.error("Failed to make token request to Keycloak: %s", e)
+            return None
+
+        return self._parse_token_response(response.status_code, response.content)
+
+    async def _get_token_single_flight(self, client: httpx.AsyncClient, semaphore: asyncio.Semaphore,
+                                       token_url: str, client_id: str,
+                                       client_secret: str) -> Optional[Dict[str, Any]]:
+        """Request a token, sharing one in-flight request between agents with the same credentials"""
+        key = (token_url, client_id, client_secret)
+        task = self._inflight.get(key)
+        if task is None:
+            async def _request() -> Optional[Dict[str, Any]]:
+                # Bounded to stay within Keycloak rate limits
+                async with semaphore:
+                    return await self._get_token_async(client, token_url, client_id, client_secret)
+
+            task = asyncio.create_task(_request())
+            self._inflight[key] = task
+        else:
+            self.logger.debug("Sharing token request for client %s with another agent", client_id)
+        return await task
 
-            return token_data
+    def load_cached_token(self, agent_name: str, client_id: str, keycloak_url: str,
+                          realm: str, oauth_tokens_dir: str) -> Optional[Dict[str, Any]]:
+        """Return the saved token for agent_name if it can be reused
 
-        except requests.exceptions.RequestException as e:
-            self.error(f"Failed to make token request to Keycloak: {e}")
+        A saved token is reused only if it was issued for the same client,
+        Keycloak URL and realm, its .env file still exists (when .env files are
+        being written), and it stays valid for more than
+        TOKEN_REFRESH_SKEW_SECONDS.
+        """
+        json_file = os.path.join(oauth_tokens_dir, f"{agent_name}-token.json")
+        env_file = os.path.join(oauth_tokens_dir, f"{agent_name}.env")
+
+        try:
+            with open(json_file, 'r') as f:
+                cached = json.load(f)
+            expires_at = cached.get('expires_at')
+            if not expires_at or not cached.get('access_token'):
+                return None
+            if self.emit_env and not os.path.exists(env_file):
+                return None
+            if (cached.get('client_id'), cached.get('keycloak_url'), cached.get('keycloak_realm')) != \
+                    (client_id, keycloak_url, realm):
+                self.logger.debug("Cached token for %s was issued for different settings", agent_name)
+                return None
+            remaining = (datetime.fromisoformat(expires_at) - datetime.now(timezone.utc)).total_seconds()
+        except FileNotFoundError:
             return None
-        except json.JSONDecodeError as e:
-            self.error(f"Invalid JSON response: {e}")
+        except (OSError, ValueError, TypeError, AttributeError) as e:
+            self.logger.debug("Ignoring unreadable cached token %s: %s", json_file, e)
+            return None
+
+        if remaining <= TOKEN_REFRESH_SKEW_SECONDS:
+            self.logger.debug("Cached token for %s expires in %.0f seconds, refreshing", agent_name, remaining)
             return None
 
+        self.logger.log(SUCCESS, "Cached token still valid for %.0f seconds: %s", remaining, json_file)
+        return cached
+
     def save_token_files(self, agent_name: str, token_data: Dict[str, Any],
                         client_id: str, client_secret: str, keycloak_url: str,
                         realm: str, oauth_tokens_dir: str) -> bool:
-        """Save token to both .env and .json files"""
+        """Save token to the .json file, and to the .env file unless disabled"""
         access_token = token_data['access_token']
         expires_in = token_data.get('expires_in')
 
         # Create output directory
         os.makedirs(oauth_tokens_dir, exist_ok=True)
 
-        # Generate timestamps
-        generated_at = datetime.now(timezone.utc).isoformat()
-        expires_at = None
-        if expires_in:
-            expiry_timestamp = datetime.now(timezone.utc).timestamp() + expires_in
-            expires_at = datetime.fromtimestamp(expiry_timestamp, timezone.utc).isoformat()
+        # Generate timestamps from a single clock reading
+        now_utc = datetime.now(timezone.utc)
+        generated_at = now_utc.isoformat()
+        expiry_dt = now_utc + timedelta(seconds=expires_in) if expires_in else None
+        expires_at = expiry_dt.isoformat() if expiry_dt else None
 
-        # Save .env file
+        # Save .env file for shell consumers
         env_file = os.path.join(oauth_tokens_dir, f"{agent_name}.env")
-        try:
-            with open(env_file, 'w') as f:
-                f.write(f"# Generated access token for {agent_name}\n")
-                f.write(f"# Generated at: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}\n")
-                f.write(f'export ACCESS_TOKEN="{access_token}"\n')
-                f.write(f'export CLIENT_ID="{client_id}"\n')
-                f.write(f'export CLIENT_SECRET="{client_secret}"\n')
-                f.write(f'export KEYCLOAK_URL="{keycloak_url}"\n')
-                f.write(f'export KEYCLOAK_REALM="{realm}"\n')
-                f.write('export AUTH_PROVIDER="keycloak"\n')
-        except Exception as e:
-            self.error(f"Failed to save .env file: {e}")
-            return False
+        if self.emit_env:
+            env_body = (
+                f"# Generated access token for {agent_name}\n"
+                f"# Generated at: {now_utc.astimezone().strftime('%Y-%m-%d %H:%M:%S')}\n"
+                f'export ACCESS_TOKEN="{access_token}"\n'
+                f'export CLIENT_ID="{client_id}"\n'
+                f'export CLIENT_SECRET="{client_secret}"\n'
+                f'export KEYCLOAK_URL="{keycloak_url}"\n'
+                f'export KEYCLOAK_REALM="{realm}"\n'
+                'export AUTH_PROVIDER="keycloak"\n'
+            )
+            try:
+                _write_file_atomic(env_file, env_body)
+            except Exception as e:
+                self.logger.error("Failed to save .env file: %s", e)
+                return False
 
         # Save .json file with metadata
         json_file = os.path.join(oauth_tokens_dir, f"{agent_name}-token.json")
@@ -181,57 +457,40 @@ class TokenGenerator:
         }
 
         try:
-            with open(json_file, 'w') as f:
-                json.dump(token_json, f, indent=2)
+            _write_file_atomic(json_file, json.dumps(token_json, indent=2))
         except Exception as e:
-            self.error(f"Failed to save JSON file: {e}")
+            self.logger.error("Failed to save JSON file: %s", e)
             return False
 
-        self.success(f"Token saved to: {env_file}")
-        self.success(f"Token metadata saved to: {json_file}")
+        if self.emit_env:
+            self.logger.log(SUCCESS, "Token saved to: %s", env_file)
+        self.logger.log(SUCCESS, "Token metadata saved to: %s", json_file)
 
         # Display token info (redacted for security)
-        try:
-            from ..utils import redact_sensitive_value
-        except ImportError:
-            # Fallback for when running as standalone script
-            import sys
-            from pathlib import Path
-            utils_path = Path(__file__).parent.parent / "utils.py"
-            if utils_path.exists():
-                sys.path.insert(0, str(utils_path.parent))
-                from utils import redact_sensitive_value
-            else:
-                # Simple fallback redaction function
-                def redact_sensitive_value(value: str, show_chars: int = 8) -> str:
-                    if not value or len(value) <= show_chars:
-                        return "*" * len(value) if value else ""
-                    return value[:show_chars] + "*" * (len(value) - show_chars)
-
         redacted_token = redact_sensitive_value(access_token, 8)
-        print(f"\nAccess Token: {redacted_token}")
+        self._print(f"\nAccess Token: {redacted_token}")
         if expires_in:
-            print(f"Expires in: {expires_in} seconds")
-            if expires_at:
-                expiry_time = datetime.fromisoformat(expires_at.replace('Z', '+00:00'))
-                print(f"Expires at: {expiry_time.strftime('%Y-%m-%d %H:%M:%S UTC')}")
-        print()
+            self._print(f"Expires in: {expires_in} seconds")
+            self._print(f"Expires at: {expiry_dt.strftime('%Y-%m-%d %H:%M:%S UTC')}")
+        self._print()
 
         return True
 
-    def generate_token_for_agent(self, agent_name: str, client_id: str = None,
-                                client_secret: str = None, keycloak_url: str = None,
-                                realm: str = "mcp-gateway", oauth_tokens_dir: str = None) -> bool:
-        """Generate token for a single agent"""
-        if oauth_tokens_dir is None:
-            oauth_tokens_dir = os.path.join(os.path.dirname(os.path.dirname(os.path.dirname(__file__))), '.oauth-tokens')
+    def _prepare_agent(self, agent_name: str, client_id: Optional[str],
+                       client_secret: Optional[str], keycloak_url: Optional[str],
+                       realm: str, oauth_tokens_dir: str,
+                       config_path: Optional[Path] = None) -> Optional[AgentJob]:
+        """Fill missing parameters from the agent config file and validate them
 
+        Only reads local files, so it can run before any network work starts.
+        Returns None after reporting what is missing.
+        """
         # Load config from JSON if parameters not provided
         config = None
         if not all([client_id, client_secret, keycloak_url]):
-            config = self.load_agent_config(agent_name, oauth_tokens_dir)
+            config = self.load_agent_config(agent_name, oauth_tokens_dir, config_path)
             if not config:
-                return False
+                return None
 
         # Use provided parameters or fall back to config
         if not client_id:
@@ -249,82 +508,185 @@ class TokenGenerator:
 
         # Validate required parameters
         if not client_id:
-            self.error("CLIENT_ID is required. Provide via --client-id or in config file.")
-            return False
+            self.logger.error("CLIENT_ID is required. Provide via --client-id or in config file.")
+            return None
         if not client_secret:
-            self.error("CLIENT_SECRET is required. Provide via --client-secret or in config file.")
-            return False
+            self.logger.error("CLIENT_SECRET is required. Provide via --client-secret or in config file.")
+            return None
         if not keycloak_url:
-            self.error("KEYCLOAK_URL is required. Provide via --keycloak-url or in config file.")
+            self.logger.error("KEYCLOAK_URL is required. Provide via --keycloak-url or in config file.")
+            return None
+
+        return AgentJob(agent_name, client_id, client_secret, keycloak_url, realm)
+
+    def generate_token_for_agent(self, agent_name: str, client_id: str = None,
+                                client_secret: str = None, keycloak_url: str = None,
+                                realm: str = "mcp-gateway", oauth_tokens_dir: str = None,
+                                config_path: Optional[Path] = None) -> bool:
+        """Generate token for a single agent"""
+        oauth_tokens_dir = oauth_tokens_dir or str(_DEFAULT_OAUTH_DIR)
+
+        job = self._prepare_agent(agent_name, client_id, client_secret,
+                                  keycloak_url, realm, oauth_tokens_dir, config_path)
+        if not job:
             return False
+        return self._run_agent(job, oauth_tokens_dir)
+
+    def _run_agent(self, job: AgentJob, oauth_tokens_dir: str) -> bool:
+        """Fetch and save the token for a prepared agent job"""
+        if not self.force_refresh and self.load_cached_token(job.name, job.client_id, job.keycloak_url,
+                                                             job.realm, oauth_tokens_dir):
+            return True
 
-        print(f"Requesting access token for agent: {agent_name}")
+        self._print(f"Requesting access token for agent: {job.name}")
 
         # Get token from Keycloak
-        token_data = self.get_token_from_keycloak(client_id, client_secret, keycloak_url, realm)
+        token_data = self._request_token(job.token_url, job.client_id, job.client_secret, job.realm)
         if not token_data:
             return False
 
-        self.success("Access token generated successfully!")
+        self.logger.log(SUCCESS, "Access token generated successfully!")
 
         # Save token files
-        return self.save_token_files(agent_name, token_data, client_id, client_secret,
-                                   keycloak_url, realm, oauth_tokens_dir)
+        return self.save_token_files(job.name, token_data, job.client_id, job.client_secret,
+                                     job.keycloak_url, job.realm, oauth_tokens_dir)
+
+    async def _run_agent_async(self, client: httpx.AsyncClient, semaphore: asyncio.Semaphore,
+                               job: AgentJob, oauth_tokens_dir: str) -> bool:
+        """Fetch and save the token for a prepared agent job in batch mode"""
+        if not self.force_refresh and self.load_cached_token(job.name, job.client_id, job.keycloak_url,
+                                                             job.realm, oauth_tokens_dir):
+            return True
 
-    def find_agent_configs(self, oauth_tokens_dir: str) -> List[str]:
-        """Find all agent-{}.json files, excluding agent-{}-token.json files"""
-        if not os.path.exists(oauth_tokens_dir):
-            self.warning(f"OAuth tokens directory not found: {oauth_tokens_dir}")
-            return []
+        self._print(f"Requesting access token for agent: {job.name}")
+
+        # Get token from Keycloak
+        self._log_token_request(job.token_url, job.client_id, job.realm)
+        token_data = await self._get_token_single_flight(client, semaphore, job.token_url,
+                                                         job.client_id, job.client_secret)
+        if not token_data:
+            return False
+
+        self.logger.log(SUCCESS, "Access token generated successfully!")
+
+        # Save token files off the event loop so other requests keep flowing
+        return await asyncio.to_thread(self.save_token_files, job.name, token_data, job.client_id,
+                                       job.client_secret, job.keycloak_url, job.realm, oauth_tokens_dir)
+
+    def find_agent_configs(self, oauth_tokens_dir: str) -> Iterator[Tuple[str, Path]]:
+        """Yield (agent name, config path) for agent-{}.json files, excluding agent-{}-token.json files
 
-        # Find all agent-*.json files
-        pattern = os.path.join(oauth_tokens_dir, "agent-*.json")
-        all_files = glob.glob(pattern)
+        Entries are yielded in directory order as the scan proceeds, so callers
+        can start work on the first agent before the scan finishes.
+        """
+        if not os.path.exists(oauth_tokens_dir):
+            self.logger.warning("OAuth tokens directory not found: %s", oauth_tokens_dir)
+            return
+
+        # Find all agent-*.json files in one directory pass, skipping token
+        # files (agent-*-token.json); the agent name is the filename without
+        # its '.json' extension
+        with os.scandir(oauth_tokens_dir) as entries:
+            for entry in entries:
+                name = entry.name
+                if (name.startswith("agent-") and name.endswith(".json")
+                        and not name.endswith("-token.json") and entry.is_file()):
+                    yield name[:-5], Path(entry.path)
+
+    def _prepare_batch_agent(self, agent_name: str, config_path: Path, keycloak_url: Optional[str],
+                             realm: str, oauth_tokens_dir: str) -> Optional[AgentJob]:
+        """Prepare one agent's job in batch mode, reporting failures in its output block"""
+        job = None
+        try:
+            job = self._prepare_agent(agent_name, None, None, keycloak_url, realm,
+                                      oauth_tokens_dir, config_path)
+        except Exception as e:
+            self.logger.error("Exception while processing agent %s: %s", agent_name, e)
+        if not job:
+            self.logger.error("Failed to generate token for agent: %s", agent_name)
+        return job
 
-        # Filter out token files (agent-*-token.json)
-        agent_configs = []
-        for file_path in all_files:
-            filename = os.path.basename(file_path)
-            if not filename.endswith('-token.json'):
-                # Use the full filename without extension as agent name
-                agent_name = filename[:-5]  # Remove '.json' (5 chars)
-                agent_configs.append(agent_name)
+    async def _process_agent(self, client: httpx.AsyncClient, semaphore: asyncio.Semaphore,
+                             job: AgentJob, oauth_tokens_dir: str) -> bool:
+        """Run one prepared job in batch mode, printing the agent's output as one block
 
-        return sorted(agent_configs)
+        The task inherits the output buffer that was current when it was
+        created, so messages from preparing the job land in the same block.
+        """
+        buffer = _output_buffer.get()
+        success = False
+        try:
+            success = await self._run_agent_async(client, semaphore, job, oauth_tokens_dir)
+            if not success:
+                self.logger.error("Failed to generate token for agent: %s", job.name)
+        except Exception as e:
+            self.logger.error("Exception while processing agent %s: %s", job.name, e)
+        finally:
+            _output_buffer.set(None)
+            _flush_output(buffer)
+        return success
+
+    async def _run_all(self, agent_configs: Iterable[Tuple[str, Path]], keycloak_url: Optional[str],
+                       realm: str, oauth_tokens_dir: str) -> Tuple[int, int]:
+        """Generate tokens for agent_configs concurrently
+
+        Each agent's config is read and validated as soon as its name is
+        produced, and only valid jobs are dispatched, so token requests
+        overlap with the directory scan and config parsing.
+
+        Returns:
+            Tuple of (success count, total count)
+        """
+        semaphore = asyncio.Semaphore(MAX_CONCURRENT_AGENTS)
+        self._inflight.clear()
+        async with _create_client() as client:
+            tasks = []
+            total = 0
+            for agent_name, config_path in agent_configs:
+                total += 1
+                buffer = [(f"\n{'='*60}\nProcessing agent: {agent_name}\n{'='*60}", None)]
+                _output_buffer.set(buffer)
+                job = self._prepare_batch_agent(agent_name, config_path, keycloak_url,
+                                                realm, oauth_tokens_dir)
+                if job:
+                    tasks.append(asyncio.create_task(self._process_agent(client, semaphore, job,
+                                                                         oauth_tokens_dir)))
+                _output_buffer.set(None)
+                if not job:
+                    _flush_output(buffer)
+                    continue
+                # Let the new task send its request before scanning on
+                await asyncio.sleep(0)
+
+            results = await asyncio.gather(*tasks)
+        return sum(results), total
 
     def generate_tokens_for_all_agents(self, oauth_tokens_dir: str = None,
                                      keycloak_url: str = None, realm: str = "mcp-gateway") -> bool:
         """Generate tokens for all agents found in .oauth-tokens directory"""
-        if oauth_tokens_dir is None:
-            oauth_tokens_dir = os.path.join(os.path.dirname(os.path.dirname(os.path.dirname(__file__))), '.oauth-tokens')
+        oauth_tokens_dir = oauth_tokens_dir or str(_DEFAULT_OAUTH_DIR)
 
-        self.log(f"Searching for agent configs in: {oauth_tokens_dir}")
+        self.logger.debug("Searching for agent configs in: %s", oauth_tokens_dir)
 
         agent_configs = self.find_agent_configs(oauth_tokens_dir)
+        if self.verbose:
+            # List agents up front in a deterministic order; otherwise they
+            # are dispatched straight from the directory scan
+            agent_configs = sorted(agent_configs)
+            if agent_configs:
+                self.logger.log(SUCCESS, "Found %s agent configuration(s): %s",
+                                len(agent_configs), ', '.join(name for name, _ in agent_configs))
+
+        # Token requests are network-bound, so agents are processed concurrently
+        # on one event loop
+        success_count, total_count = asyncio.run(
+            self._run_all(agent_configs, keycloak_url, realm, oauth_tokens_dir)
+        )
 
-        if not agent_configs:
-            self.warning("No agent configuration files found")
+        if not total_count:
+            self.logger.warning("No agent configuration files found")
             return True
 
-        self.success(f"Found {len(agent_configs)} agent configuration(s): {', '.join(agent_configs)}")
-
-        success_count = 0
-        total_count = len(agent_configs)
-
-        for agent_name in agent_configs:
-            print(f"\n{'='*60}")
-            print(f"Processing agent: {agent_name}")
-            print('='*60)
-
-            try:
-                if self.generate_token_for_agent(agent_name, keycloak_url=keycloak_url,
-                                               realm=realm, oauth_tokens_dir=oauth_tokens_dir):
-                    success_count += 1
-                else:
-                    self.error(f"Failed to generate token for agent: {agent_name}")
-            except Exception as e:
-                self.error(f"Exception while processing agent {agent_name}: {e}")
-
         print(f"\n{'='*60}")
         print(f"Token generation complete: {success_count}/{total_count} successful")
         print('='*60)
@@ -350,6 +712,12 @@ Examples:
 
   # Generate tokens for all agents with custom Keycloak URL
   python generate_tokens.py --all-agents --keycloak-url http://localhost:8080
+
+  # Request new tokens even if the saved ones are still valid
+  python generate_tokens.py --all-agents --force
+
+  # Only write the JSON token files, skipping the shell .env files
+  python generate_tokens.py --all-agents --no-emit-env
         """
     )
 
@@ -367,6 +735,10 @@ Examples:
                        help='Keycloak realm (default: mcp-gateway)')
     parser.add_argument('--oauth-dir', type=str,
                        help='OAuth tokens directory (default: ../../.oauth-tokens)')
+    parser.add_argument('--force', action='store_true',
+                       help='Request new tokens even if saved tokens are still valid')
+    parser.add_argument('--emit-env', action=argparse.BooleanOptionalAction, default=True,
+                       help='Also write a shell .env file next to each token JSON (default: enabled)')
     parser.add_argument('--verbose', '-v', action='store_true',
                        help='Verbose output')
 
@@ -380,12 +752,11 @@ Examples:
         parser.error("Cannot specify both --all-agents and --agent-name")
 
     # Initialize token generator
-    generator = TokenGenerator(verbose=args.verbose)
+    generator = TokenGenerator(verbose=args.verbose, force_refresh=args.force,
+                               emit_env=args.emit_env)
 
     # Determine oauth tokens directory
-    oauth_tokens_dir = args.oauth_dir
-    if oauth_tokens_dir is None:
-        oauth_tokens_dir = os.path.join(os.path.dirname(os.path.dirname(os.path.dirname(__file__))), '.oauth-tokens')
+    oauth_tokens_dir = args.oauth_dir or str(_DEFAULT_OAUTH_DIR)
 
     try:
         if args.all_agents:
@@ -409,10 +780,10 @@ Examples:
         sys.exit(0 if success else 1)
 
     except KeyboardInterrupt:
-        generator.warning("Operation interrupted by user")
+        generator.logger.warning("Operation interrupted by user")
         sys.exit(1)
     except Exception as e:
-        generator.error(f"Unexpected error: {e}")
+        generator.logger.error("Unexpected error: %s", e)
         sys.exit(1)
 
 
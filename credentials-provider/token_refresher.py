@@ -276,8 +276,9 @@ def _refresh_agentcore_token(token_data: Dict, filename: str) -> bool:
         
         logger.info(f"Refreshing AgentCore token for: {server_name or 'default'}")
         
-        # Run the refresh script using uv run
-        cmd = ["uv", "run", "python", str(script_path)]
+        # Run the refresh script using uv run; --force skips the script's own
+        # reuse check, since the token is already within our expiry buffer
+        cmd = ["uv", "run", "python", str(script_path), "--force"]
         if server_name:
             # The script might accept server-specific parameters
             # Check the script for available options
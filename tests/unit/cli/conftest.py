@@ -0,0 +1,95 @@
+"""
+Shared fixtures for CLI utility tests.
+
+The cli/ scripts import each other as top-level modules, so the directory
+is put on sys.path instead of being imported as a package.
+"""
+import json
+import sys
+from pathlib import Path
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+import pytest
+
+CLI_DIR = Path(__file__).resolve().parents[3] / "cli"
+if str(CLI_DIR) not in sys.path:
+    sys.path.insert(0, str(CLI_DIR))
+
+import mcp_utils  # noqa: E402
+
+
+@pytest.fixture
+def isolated_cli(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> Path:
+    """Keep clients away from real tokens and the user's session cache."""
+    monkeypatch.chdir(tmp_path)
+    monkeypatch.delenv("MCP_AUTH_TOKEN", raising=False)
+    monkeypatch.setattr(mcp_utils, "SESSION_CACHE_FILE", tmp_path / "cache" / "session.json")
+    return tmp_path
+
+
+class FakeGateway:
+    """
+    Stand-in for MCPClient._post that answers JSON-RPC requests in memory.
+
+    Handlers map a method name to a function of (request, session_id)
+    returning the response dict. Every request is recorded together with the
+    session id it was sent with.
+    """
+
+    def __init__(self, client: "mcp_utils.MCPClient", session_id: str = "session-1"):
+        self.client = client
+        self.session_id = session_id
+        self.requests: List[Tuple[Any, Optional[str]]] = []
+        self.notifications: List[Optional[str]] = []
+        self.handlers: Dict[str, Callable[[Dict[str, Any], Optional[str]], Dict[str, Any]]] = {
+            "initialize": lambda request, _: {
+                "jsonrpc": "2.0", "id": request["id"], "result": {"capabilities": {}}
+            },
+        }
+
+    def respond(self, request: Dict[str, Any]) -> Dict[str, Any]:
+        """Answer one request from the handlers, echoing the method by default."""
+        handler = self.handlers.get(request["method"])
+        if handler is not None:
+            return handler(request, self.client.session_id)
+        return {"jsonrpc": "2.0", "id": request["id"], "result": {"method": request["method"]}}
+
+    def post(self, data: bytes) -> Any:
+        payload = json.loads(data)
+        self.requests.append((payload, self.client.session_id))
+        if isinstance(payload, list):
+            response = [self.respond(request) for request in payload if "id" in request]
+        else:
+            response = self.respond(payload)
+        # The gateway assigns a session id on the first response
+        if not self.client.session_id:
+            self.client.session_id = self.session_id
+        return response
+
+    def send_initialized(self) -> None:
+        self.notifications.append(self.client.session_id)
+
+    def methods(self) -> List[Any]:
+        """Methods of the recorded requests, with batches as lists."""
+        return [
+            [request["method"] for request in payload] if isinstance(payload, list) else payload["method"]
+            for payload, _ in self.requests
+        ]
+
+
+@pytest.fixture
+def make_client(isolated_cli: Path, monkeypatch: pytest.MonkeyPatch):
+    """Build an MCPClient wired to a FakeGateway instead of the network."""
+    clients = []
+
+    def factory(**kwargs) -> Tuple["mcp_utils.MCPClient", FakeGateway]:
+        client = mcp_utils.MCPClient("http://gateway.test/mcp", **kwargs)
+        gateway = FakeGateway(client)
+        monkeypatch.setattr(client, "_post", gateway.post)
+        monkeypatch.setattr(client, "_send_initialized", gateway.send_initialized)
+        clients.append(client)
+        return client, gateway
+
+    yield factory
+    for client in clients:
+        client.close()
@@ -0,0 +1,229 @@
+"""
+Unit tests for the opt-in MCP session cache in cli/mcp_utils.py.
+"""
+
+import json
+import time
+
+import pytest
+
+import mcp_utils
+
+
+def _session_error(request, _):
+    return {
+        "jsonrpc": "2.0",
+        "id": request["id"],
+        "error": {"code": mcp_utils.SESSION_NOT_FOUND_CODE, "message": "Session not found"}
+    }
+
+
+@pytest.mark.unit
+class TestSessionCacheFile:
+    """Test loading, storing, expiring and removing cache entries."""
+
+    def test_store_then_load(self, isolated_cli):
+        """Test a stored entry is returned while fresh."""
+        entry = {"session_id": "abc", "established_at": time.time(), "initialize_result": {"id": 1}}
+        mcp_utils._store_cached_session("key", entry, ttl=60)
+
+        assert mcp_utils._load_cached_session("key", ttl=60) == entry
+
+    def test_cache_file_is_private(self, isolated_cli):
+        """Test the cache file is only readable by its owner."""
+        mcp_utils._store_cached_session("key", {"session_id": "abc", "established_at": time.time()}, ttl=60)
+
+        assert mcp_utils.SESSION_CACHE_FILE.stat().st_mode & 0o777 == 0o600
+
+    def test_load_missing_file(self, isolated_cli):
+        """Test a missing cache file means no cached session."""
+        assert mcp_utils._load_cached_session("key", ttl=60) is None
+
+    def test_load_corrupt_file(self, isolated_cli):
+        """Test an unreadable cache file is ignored."""
+        mcp_utils.SESSION_CACHE_FILE.parent.mkdir(parents=True)
+        mcp_utils.SESSION_CACHE_FILE.write_text("not json")
+
+        assert mcp_utils._load_cached_session("key", ttl=60) is None
+
+    def test_expired_entry_not_loaded(self, isolated_cli):
+        """Test entries older than the TTL are not reused."""
+        entry = {"session_id": "abc", "established_at": time.time() - 120}
+        mcp_utils._store_cached_session("key", entry, ttl=600)
+
+        assert mcp_utils._load_cached_session("key", ttl=60) is None
+        assert mcp_utils._load_cached_session("key", ttl=600) == entry
+
+    def test_store_prunes_expired_entries(self, isolated_cli):
+        """Test storing an entry drops other entries past the TTL."""
+        mcp_utils._store_cached_session("old", {"session_id": "a", "established_at": time.time() - 120}, ttl=600)
+        mcp_utils._store_cached_session("new", {"session_id": "b", "established_at": time.time()}, ttl=60)
+
+        cache = json.loads(mcp_utils.SESSION_CACHE_FILE.read_text())
+        assert set(cache) == {"new"}
+
+    def test_store_none_removes_entry(self, isolated_cli):
+        """Test invalidating an entry removes only that entry."""
+        now = time.time()
+        mcp_utils._store_cached_session("a", {"session_id": "a", "established_at": now}, ttl=60)
+        mcp_utils._store_cached_session("b", {"session_id": "b", "established_at": now}, ttl=60)
+
+        mcp_utils._store_cached_session("a", None, ttl=60)
+
+        assert mcp_utils._load_cached_session("a", ttl=60) is None
+        assert mcp_utils._load_cached_session("b", ttl=60)["session_id"] == "b"
+
+    def test_cache_key_separates_credentials(self):
+        """Test sessions for different tokens or gateways never share a key."""
+        key = mcp_utils._session_cache_key("http://gw/mcp", "token-a", None)
+
+        assert key == mcp_utils._session_cache_key("http://gw/mcp", "token-a", None)
+        assert key != mcp_utils._session_cache_key("http://gw/mcp", "token-b", None)
+        assert key != mcp_utils._session_cache_key("http://other/mcp", "token-a", None)
+
+
+@pytest.mark.unit
+class TestClientSessionCache:
+    """Test how MCPClient uses the session cache."""
+
+    def test_disabled_by_default(self, make_client):
+        """Test a default client neither reads nor writes the cache file."""
+        client, gateway = make_client()
+        client.initialize()
+        client.ping()
+
+        assert client._session_cache_key is None
+        assert not mcp_utils.SESSION_CACHE_FILE.exists()
+        assert gateway.methods() == ["initialize", "ping"]
+
+    def test_initialize_stores_session(self, make_client):
+        """Test an opted-in client persists the negotiated session."""
+        client, _ = make_client(session_cache_ttl=60)
+        result = client.initialize()
+
+        entry = mcp_utils._load_cached_session(client._session_cache_key, ttl=60)
+        assert entry["session_id"] == "session-1"
+        assert entry["initialize_result"] == result
+
+    def test_restored_session_skips_initialize(self, make_client):
+        """Test a later client reuses the cached session without a handshake."""
+        first, _ = make_client(session_cache_ttl=60)
+        first.initialize()
+
+        second, gateway = make_client(session_cache_ttl=60)
+        second.initialize()
+        second.ping()
+
+        assert gateway.methods() == ["ping"]
+        assert gateway.requests[0][1] == "session-1"
+        assert gateway.notifications == []
+
+    def test_expired_session_not_restored(self, make_client):
+        """Test a session older than the TTL triggers a fresh handshake."""
+        first, _ = make_client(session_cache_ttl=60)
+        mcp_utils._store_cached_session(first._session_cache_key, {
+            "session_id": "stale", "established_at": time.time() - 120, "initialize_result": {}
+        }, ttl=600)
+
+        second, gateway = make_client(session_cache_ttl=60)
+        second.initialize()
+
+        assert second.session_id == "session-1"
+        assert gateway.methods() == ["initialize"]
+
+    def test_session_not_found_error_invalidates(self, make_client):
+        """Test a session-not-found JSON-RPC error re-initializes and retries."""
+        first, _ = make_client(session_cache_ttl=60)
+        first.initialize()
+
+        second, gateway = make_client(session_cache_ttl=60)
+        gateway.session_id = "session-2"
+        gateway.handlers["ping"] = lambda request, session_id: (
+            _session_error(request, session_id) if session_id == "session-1"
+            else {"jsonrpc": "2.0", "id": request["id"], "result": {}}
+        )
+        second.initialize()
+
+        assert second.ping()["result"] == {}
+        assert gateway.methods() == ["ping", "initialize", "ping"]
+        assert gateway.notifications == ["session-2"]
+        entry = mcp_utils._load_cached_session(second._session_cache_key, ttl=60)
+        assert entry["session_id"] == "session-2"
+
+    def test_http_404_invalidates(self, make_client, monkeypatch):
+        """Test an HTTP 404 for a restored session re-initializes and retries."""
+        first, _ = make_client(session_cache_ttl=60)
+        first.initialize()
+
+        second, gateway = make_client(session_cache_ttl=60)
+        gateway.session_id = "session-2"
+        post = gateway.post
+
+        def post_or_404(data):
+            if second.session_id == "session-1":
+                raise mcp_utils._HTTPStatusError(404, "HTTP 404: Session not found")
+            return post(data)
+
+        monkeypatch.setattr(second, "_post", post_or_404)
+        second.initialize()
+
+        assert second.ping()["result"] == {"method": "ping"}
+        assert gateway.methods() == ["initialize", "ping"]
+
+    def test_other_errors_keep_session(self, make_client):
+        """Test unrelated errors mentioning a session do not wipe the cache."""
+        first, _ = make_client(session_cache_ttl=60)
+        first.initialize()
+
+        second, gateway = make_client(session_cache_ttl=60)
+        gateway.handlers["ping"] = lambda request, _: {
+            "jsonrpc": "2.0",
+            "id": request["id"],
+            "error": {"code": -32603, "message": "Internal error while reading session data"}
+        }
+        second.initialize()
+
+        assert "error" in second.ping()
+        assert gateway.methods() == ["ping"]
+        entry = mcp_utils._load_cached_session(second._session_cache_key, ttl=60)
+        assert entry["session_id"] == "session-1"
+
+    def test_http_400_is_not_a_session_error(self, make_client, monkeypatch):
+        """Test non-404 HTTP errors are raised without re-initializing."""
+        first, _ = make_client(session_cache_ttl=60)
+        first.initialize()
+
+        second, gateway = make_client(session_cache_ttl=60)
+
+        def bad_request(data):
+            raise mcp_utils._HTTPStatusError(400, "HTTP 400: Bad Request")
+
+        monkeypatch.setattr(second, "_post", bad_request)
+        second.initialize()
+
+        with pytest.raises(mcp_utils._HTTPStatusError):
+            second.ping()
+        assert mcp_utils._load_cached_session(second._session_cache_key, ttl=60) is not None
+
+
+@pytest.mark.unit
+class TestSessionCacheFactories:
+    """Test the factory functions pass the cache TTL through."""
+
+    def test_create_mcp_client_default_disabled(self, isolated_cli):
+        """Test factories keep the cache disabled unless asked."""
+        client = mcp_utils.create_mcp_client("http://gateway.test/mcp")
+        try:
+            assert client.session_cache_ttl == 0
+            assert client._session_cache_key is None
+        finally:
+            client.close()
+
+    def test_create_mcp_session_enables_cache(self, isolated_cli):
+        """Test create_mcp_session forwards session_cache_ttl to the client."""
+        session = mcp_utils.create_mcp_session("http://gateway.test/mcp", session_cache_ttl=60)
+        try:
+            assert session.client.session_cache_ttl == 60
+            assert session.client._session_cache_key is not None
+        finally:
+            session.client.close()
@@ -0,0 +1,303 @@
+"""
+Unit tests for SSE parsing and batched calls in cli/mcp_utils.py.
+"""
+
+import base64
+import json
+from typing import Iterator, List
+
+import pytest
+
+import mcp_utils
+from mcp_utils import Call
+
+
+def _feed_all(chunks: List[bytes]) -> List[dict]:
+    parser = mcp_utils._SSEParser()
+    events = [event for chunk in chunks for event in parser.feed(chunk)]
+    return events + list(parser.close())
+
+
+class FakeSSEResponse:
+    """Minimal streaming response exposing iter_content like requests."""
+
+    def __init__(self, chunks: List[bytes]):
+        self.chunks = chunks
+        self.chunks_read = 0
+
+    def iter_content(self, chunk_size=None) -> Iterator[bytes]:
+        for chunk in self.chunks:
+            self.chunks_read += 1
+            yield chunk
+
+
+def _advertise_input_from(gateway) -> None:
+    gateway.handlers["initialize"] = lambda request, _: {
+        "jsonrpc": "2.0",
+        "id": request["id"],
+        "result": {"capabilities": {"experimental": {mcp_utils.INPUT_FROM_PARAM: {}}}}
+    }
+
+
+@pytest.mark.unit
+class TestSSEParser:
+    """Test the incremental event-stream parser."""
+
+    def test_single_event(self):
+        """Test one data line terminated by a blank line."""
+        assert _feed_all([b'data: {"a": 1}\n\n']) == [{"data": '{"a": 1}'}]
+
+    def test_crlf_line_endings(self):
+        """Test CRLF-terminated lines parse like LF ones."""
+        events = _feed_all([b'event: message\r\nid: 7\r\ndata: {"a": 1}\r\n\r\n'])
+
+        assert events == [{"data": '{"a": 1}', "event": "message", "id": "7"}]
+
+    def test_crlf_split_across_chunks(self):
+        """Test a CR and its LF arriving in different chunks."""
+        events = _feed_all([b'data: {"a": 1}\r', b'\n\r', b'\n'])
+
+        assert events == [{"data": '{"a": 1}'}]
+
+    def test_comment_lines_ignored(self):
+        """Test keep-alive comments neither add data nor end an event."""
+        events = _feed_all([b': ping\n\n: keep-alive\ndata: x\n: more\n\n'])
+
+        assert events == [{"data": "x"}]
+
+    def test_multi_line_data_joined(self):
+        """Test several data fields of one event are joined with newlines."""
+        events = _feed_all([b'data: {"a":\ndata: 1}\n\n'])
+
+        assert events == [{"data": '{"a":\n1}'}]
+
+    def test_event_split_across_chunks(self):
+        """Test partial lines are buffered until the newline arrives."""
+        events = _feed_all([b'da', b'ta: {"a"', b': 1}\n', b'\n'])
+
+        assert events == [{"data": '{"a": 1}'}]
+
+    def test_value_without_space(self):
+        """Test only one leading space is stripped from a field value."""
+        assert _feed_all([b'data:x\ndata:  y\n\n']) == [{"data": "x\n y"}]
+
+    def test_event_without_data_not_dispatched(self):
+        """Test events carrying no data field are dropped."""
+        assert _feed_all([b'event: ping\n\n']) == []
+        assert _feed_all([b'event: ping\n\ndata: x\n\n']) == [{"data": "x"}]
+
+    def test_close_flushes_unterminated_event(self):
+        """Test a final event without the trailing blank line is still emitted."""
+        assert _feed_all([b'data: {"tail": 1}']) == [{"data": '{"tail": 1}'}]
+
+    def test_close_with_nothing_pending(self):
+        """Test closing after complete events emits nothing more."""
+        parser = mcp_utils._SSEParser()
+        list(parser.feed(b'data: x\n\n'))
+
+        assert list(parser.close()) == []
+
+
+@pytest.mark.unit
+class TestSSEResponse:
+    """Test how MCPClient reads SSE response bodies."""
+
+    def test_returns_first_json_event(self, make_client):
+        """Test non-JSON events are skipped and reading stops at the first JSON one."""
+        client, _ = make_client()
+        response = FakeSSEResponse([
+            b'data: not json\n\n',
+            b'data: {"jsonrpc": "2.0", "id": 1, "result": {}}\n\n',
+            b'data: {"never": "read"}\n\n',
+        ])
+
+        assert client._parse_sse_response(response) == {"jsonrpc": "2.0", "id": 1, "result": {}}
+        assert response.chunks_read == 2
+
+    def test_no_json_event_raises(self, make_client):
+        """Test a stream without any JSON event is an error."""
+        client, _ = make_client()
+
+        with pytest.raises(Exception, match="No valid JSON found"):
+            client._parse_sse_response(FakeSSEResponse([b': ping\n\n', b'data: nope\n\n']))
+
+    def test_overflow_raises(self, make_client):
+        """Test reading stops once max_sse_bytes is exceeded."""
+        client, _ = make_client(max_sse_bytes=1024)
+        response = FakeSSEResponse([b'data: ' + b'x' * 500 + b'\n\n'] * 10)
+
+        with pytest.raises(Exception, match="SSE response too large"):
+            client._parse_sse_response(response)
+        assert response.chunks_read == 3
+
+    def test_event_within_limit(self, make_client):
+        """Test a JSON event ending exactly at the limit is accepted."""
+        body = b'data: {"ok": true}\n\n'
+        client, _ = make_client(max_sse_bytes=len(body))
+
+        assert client._parse_sse_response(FakeSSEResponse([body])) == {"ok": True}
+
+    def test_default_limit(self, make_client):
+        """Test clients use DEFAULT_MAX_SSE_BYTES unless told otherwise."""
+        client, _ = make_client()
+
+        assert client.max_sse_bytes == mcp_utils.DEFAULT_MAX_SSE_BYTES
+
+
+def _make_jwt(claims: dict) -> str:
+    payload = base64.urlsafe_b64encode(json.dumps(claims).encode()).rstrip(b"=").decode()
+    return f"header.{payload}.signature"
+
+
+@pytest.mark.unit
+class TestDecodeJwtPayload:
+    """Test decoding JWT claims for expiry checks."""
+
+    def test_unpadded_payload(self):
+        """Test payloads with stripped base64 padding are decoded."""
+        assert mcp_utils.decode_jwt_payload(_make_jwt({"exp": 1700000000})) == {"exp": 1700000000}
+
+    @pytest.mark.parametrize("token", ["not-a-jwt", "a.b", "a.b.c.d", "header.!!!.signature"])
+    def test_invalid_token(self, token):
+        """Test malformed tokens raise ValueError."""
+        with pytest.raises(ValueError, match="Invalid JWT format"):
+            mcp_utils.decode_jwt_payload(token)
+
+
+@pytest.mark.unit
+class TestSelectJsonPath:
+    """Test the JSONPath subset used to resolve dependencies."""
+
+    data = {"result": {"tools": [{"name": "first"}, {"name": "second"}]}}
+
+    def test_root(self):
+        """Test "$" selects the whole document."""
+        assert mcp_utils._select_json_path(self.data, "$") is self.data
+
+    def test_keys_and_indexes(self):
+        """Test dotted keys combined with list indexes."""
+        assert mcp_utils._select_json_path(self.data, "$.result.tools[1].name") == "second"
+
+    @pytest.mark.parametrize("path", ["result.tools", "$result", "$.result..tools", "$.result.tools[x]"])
+    def test_malformed_path(self, path):
+        """Test malformed paths are rejected."""
+        with pytest.raises(ValueError, match="JSON path"):
+            mcp_utils._select_json_path(self.data, path)
+
+    @pytest.mark.parametrize("path", ["$.missing", "$.result.tools[5]", "$.result.tools.name"])
+    def test_path_not_matching(self, path):
+        """Test paths that do not match the data are rejected."""
+        with pytest.raises(ValueError, match="does not match"):
+            mcp_utils._select_json_path(self.data, path)
+
+
+@pytest.mark.unit
+class TestCallBatch:
+    """Test batched JSON-RPC calls."""
+
+    def test_single_round_trip(self, make_client):
+        """Test independent calls go out as one batch."""
+        client, gateway = make_client()
+        results = client.call_batch([("ping", None), ("tools/list", None)])
+
+        assert gateway.methods() == [["ping", "tools/list"]]
+        assert [r["result"]["method"] for r in results] == ["ping", "tools/list"]
+
+    def test_out_of_order_responses_matched_by_id(self, make_client, monkeypatch):
+        """Test responses are returned in call order whatever order they arrive in."""
+        client, gateway = make_client()
+        monkeypatch.setattr(client, "_post", lambda data: list(reversed(gateway.post(data))))
+
+        results = client.call_batch([("ping", None), ("tools/list", None), ("resources/list", None)])
+
+        assert [r["result"]["method"] for r in results] == ["ping", "tools/list", "resources/list"]
+        sent_ids = [request["id"] for request in gateway.requests[0][0]]
+        assert [r["id"] for r in results] == sent_ids
+
+    def test_missing_response_raises(self, make_client, monkeypatch):
+        """Test a batch response lacking one of the ids is an error."""
+        client, gateway = make_client()
+        monkeypatch.setattr(client, "_post", lambda data: gateway.post(data)[:1])
+
+        with pytest.raises(Exception, match="No response for batched request id"):
+            client.call_batch([("ping", None), ("tools/list", None)])
+
+    def test_single_error_response_raises(self, make_client, monkeypatch):
+        """Test a batch answered with one error object is an error."""
+        client, _ = make_client()
+        monkeypatch.setattr(client, "_post", lambda data: {
+            "jsonrpc": "2.0", "id": None, "error": {"code": -32600, "message": "Invalid Request"}
+        })
+
+        with pytest.raises(Exception, match="MCP batch error"):
+            client.call_batch([("ping", None), ("tools/list", None)])
+
+    @pytest.mark.parametrize("call", [
+        Call("tools/call", depends_on=1, jsonpath="$.result", target="name"),
+        Call("tools/call", depends_on=0, target="name"),
+        Call("tools/call", depends_on=0, jsonpath="$.result"),
+    ])
+    def test_invalid_dependency(self, make_client, call):
+        """Test dependencies must point backwards and say what to copy where."""
+        client, gateway = make_client()
+
+        with pytest.raises(ValueError):
+            client.call_batch([Call("tools/list"), call])
+        assert gateway.requests == []
+
+    def test_dependency_sent_in_batch_when_advertised(self, make_client):
+        """Test dependent calls carry x-input-from when the server supports it."""
+        client, gateway = make_client()
+        _advertise_input_from(gateway)
+        client.initialize()
+
+        client.call_batch([
+            Call("tools/list"),
+            Call("tools/call", {"arguments": {}}, depends_on=0,
+                 jsonpath="$.result.tools[0].name", target="name"),
+        ])
+
+        assert gateway.methods() == ["initialize", ["tools/list", "tools/call"]]
+        dependent = gateway.requests[1][0][1]
+        assert dependent["params"] == {
+            "arguments": {},
+            mcp_utils.INPUT_FROM_PARAM: {"index": 0, "select": "$.result.tools[0].name", "target": "name"}
+        }
+
+    def test_sequential_fallback_substitutes_value(self, make_client):
+        """Test dependencies are resolved client-side without the extension."""
+        client, gateway = make_client()
+        gateway.handlers["tools/list"] = lambda request, _: {
+            "jsonrpc": "2.0", "id": request["id"], "result": {"tools": [{"name": "echo"}]}
+        }
+        client.initialize()
+
+        results = client.call_batch([
+            Call("tools/list"),
+            Call("tools/call", {"arguments": {"params": {}}}, depends_on=0,
+                 jsonpath="$.result.tools[0].name", target="name"),
+            Call("tools/call", {"name": "other"}, depends_on=0,
+                 jsonpath="$.result.tools[0].name", target="arguments.params.tool"),
+        ])
+
+        assert gateway.methods() == ["initialize", "tools/list", "tools/call", "tools/call"]
+        assert gateway.requests[2][0]["params"] == {"arguments": {"params": {}}, "name": "echo"}
+        assert gateway.requests[3][0]["params"] == {
+            "name": "other", "arguments": {"params": {"tool": "echo"}}
+        }
+        assert all(mcp_utils.INPUT_FROM_PARAM not in payload.get("params", {})
+                   for payload, _ in gateway.requests)
+        assert [r["result"]["method"] for r in results[1:]] == ["tools/call", "tools/call"]
+
+    def test_sequential_fallback_does_not_mutate_calls(self, make_client):
+        """Test the caller's params are left untouched by substitution."""
+        client, gateway = make_client()
+        params = {"name": "echo", "arguments": {"params": {}}}
+        client.call_batch([
+            Call("ping"),
+            Call("tools/call", params, depends_on=0, jsonpath="$.result.method",
+                 target="arguments.params.query"),
+        ])
+
+        assert params == {"name": "echo", "arguments": {"params": {}}}
+        assert gateway.requests[1][0]["params"]["arguments"] == {"params": {"query": "ping"}}
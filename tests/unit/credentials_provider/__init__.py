@@ -0,0 +1 @@
+"""Unit tests for credentials-provider scripts."""
@@ -0,0 +1,15 @@
+"""
+Shared fixtures for credentials-provider script tests.
+
+The scripts live in directories whose names are not valid package names,
+so each script directory is put on sys.path and imported as a top-level
+module.
+"""
+import sys
+from pathlib import Path
+
+CREDENTIALS_PROVIDER_DIR = Path(__file__).resolve().parents[3] / "credentials-provider"
+for script_dir in ("agentcore-auth", "keycloak"):
+    path = str(CREDENTIALS_PROVIDER_DIR / script_dir)
+    if path not in sys.path:
+        sys.path.insert(0, path)
@@ -0,0 +1,67 @@
+"""
+Unit tests for gateway configuration loading in generate_access_token.py.
+"""
+
+from typing import Dict
+
+import pytest
+
+import generate_access_token
+
+
+@pytest.fixture
+def agentcore_env(monkeypatch: pytest.MonkeyPatch) -> Dict[str, str]:
+    """Replace the AGENTCORE_* snapshot so .env and os.environ are never read."""
+    env: Dict[str, str] = {}
+    monkeypatch.setattr(generate_access_token, "_AGENTCORE_ENV", env)
+    monkeypatch.setattr(generate_access_token, "_ENV_LOADED", True)
+    return env
+
+
+@pytest.mark.unit
+class TestLoadGatewayConfigs:
+    """Test bucketing of AGENTCORE_{FIELD}_{N} variables."""
+
+    def test_numbered_configs_in_index_order(self, agentcore_env):
+        """Test configurations are returned sorted by their index."""
+        agentcore_env.update({
+            "AGENTCORE_CLIENT_ID_10": "c10", "AGENTCORE_CLIENT_SECRET_10": "s10",
+            "AGENTCORE_CLIENT_ID_2": "c2", "AGENTCORE_CLIENT_SECRET_2": "s2",
+            "AGENTCORE_SERVER_NAME_2": "Two",
+        })
+
+        configs = generate_access_token._load_gateway_configs()
+
+        assert [(c["index"], c["client_id"], c["server_name"]) for c in configs] == [
+            (2, "c2", "Two"), (10, "c10", None)
+        ]
+
+    @pytest.mark.parametrize("suffix", ["01", "001"])
+    def test_zero_padded_suffix_does_not_shadow_index(self, agentcore_env, suffix):
+        """Test _01 style names never replace the values of _1."""
+        agentcore_env.update({
+            "AGENTCORE_CLIENT_ID_1": "c1",
+            "AGENTCORE_CLIENT_SECRET_1": "s1",
+            "AGENTCORE_SERVER_NAME_1": "One",
+            f"AGENTCORE_CLIENT_ID_{suffix}": "zz",
+            f"AGENTCORE_CLIENT_SECRET_{suffix}": "zz-secret",
+        })
+
+        configs = generate_access_token._load_gateway_configs()
+
+        assert configs == [{
+            "client_id": "c1", "client_secret": "s1", "gateway_arn": None,
+            "server_name": "One", "index": 1
+        }]
+
+    def test_index_zero_ignored(self, agentcore_env):
+        """Test numbering starts at 1."""
+        agentcore_env.update({"AGENTCORE_CLIENT_ID_0": "c0", "AGENTCORE_CLIENT_SECRET_0": "s0"})
+
+        assert generate_access_token._load_gateway_configs() == []
+
+    def test_incomplete_config_skipped(self, agentcore_env):
+        """Test a config without its secret is skipped."""
+        agentcore_env.update({"AGENTCORE_CLIENT_ID_1": "c1", "AGENTCORE_SERVER_NAME_1": "One"})
+
+        assert generate_access_token._load_gateway_configs() == []
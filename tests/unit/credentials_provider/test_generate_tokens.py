@@ -0,0 +1,50 @@
+"""
+Unit tests for Keycloak token request retries in generate_tokens.py.
+"""
+
+from datetime import datetime, timedelta, timezone
+from email.utils import format_datetime
+
+import httpx
+import pytest
+
+import generate_tokens
+
+
+def _response(**headers) -> httpx.Response:
+    return httpx.Response(503, headers=headers)
+
+
+@pytest.mark.unit
+class TestRetryDelay:
+    """Test the wait between retried token requests."""
+
+    def test_exponential_backoff_without_retry_after(self):
+        """Test the delay doubles with each attempt."""
+        delays = [generate_tokens._retry_delay(_response(), attempt) for attempt in range(3)]
+
+        factor = generate_tokens.RETRY_BACKOFF_FACTOR
+        assert delays == [factor, factor * 2, factor * 4]
+
+    def test_retry_after_seconds(self):
+        """Test a Retry-After delay in seconds overrides the backoff."""
+        assert generate_tokens._retry_delay(_response(**{"Retry-After": "2"}), 0) == 2.0
+
+    def test_retry_after_http_date(self):
+        """Test a Retry-After HTTP date is turned into a delay."""
+        retry_at = datetime.now(timezone.utc) + timedelta(seconds=30)
+        response = _response(**{"Retry-After": format_datetime(retry_at, usegmt=True)})
+
+        assert 25 < generate_tokens._retry_delay(response, 0) <= 30
+
+    def test_retry_after_in_the_past(self):
+        """Test a Retry-After date that has passed means no wait."""
+        retry_at = datetime.now(timezone.utc) - timedelta(seconds=30)
+        response = _response(**{"Retry-After": format_datetime(retry_at, usegmt=True)})
+
+        assert generate_tokens._retry_delay(response, 0) == 0.0
+
+    def test_invalid_retry_after_falls_back(self):
+        """Test an unparsable Retry-After falls back to the backoff."""
+        assert generate_tokens._retry_delay(_response(**{"Retry-After": "soon"}), 1) == \
+            generate_tokens.RETRY_BACKOFF_FACTOR * 2